@@ -7,28 +7,58 @@ eGovのAPI v2を利用して，法令を取得するコード
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Dict, Literal
-from xml.etree import ElementTree
+from io import BytesIO
+from itertools import repeat
+from typing import Any, Dict, Iterator, List, Literal
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from elaws_parser.utils.cache import disk_cached
+from elaws_parser.utils.xml_utils import HAS_LXML, ElementTree, fromstring
+
+logger = logging.getLogger(__name__)
+
+# APIリクエストのタイムアウト(秒)
+REQUEST_TIMEOUT = 30
+
+# 接続を使い回すため，モジュール全体で一つのセッションを共有する
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
 
 
 @lru_cache
+@disk_cached
 def get_lawid_from_lawtitle(
     law_title: str, *, if_exact: bool = True
 ) -> str | Dict[str, str]:
-    """APIから法令タイトルでヒットする法令IDを取得(完全一致のみ)"""
+    """APIから法令タイトルでヒットする法令IDを取得(完全一致のみ)
+
+    Raises:
+        requests.HTTPError: APIがエラーを返した場合
+        ValueError: レスポンスに法令一覧(laws)がない場合
+            (例外はメモリ・ディスクのどちらのキャッシュにも残らないので，
+            一時的なエラーは次の呼び出しで再取得される)
+    """
     url = "https://laws.e-gov.go.jp/api/2/laws"
-    r = requests.get(url, params={"response_format": "xml", "law_title": law_title})
+    r = _SESSION.get(
+        url,
+        params={"response_format": "xml", "law_title": law_title},
+        timeout=REQUEST_TIMEOUT,
+    )
+    r.raise_for_status()
     # XMLデータの解析
-    root = ElementTree.fromstring(r.content.decode(encoding="utf-8"))
+    # バイト列のまま渡し，文書全体のstrへのデコードを省く
+    root = fromstring(r.content)
 
     laws_elem = root.find("laws")
     if laws_elem is None:
-        print("Error: 'laws' element not found in response.")
-        return {}
+        raise ValueError(f"'laws' element not found in response for {law_title}")
 
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     counter = 0
     law_dict = {}  # 辞書{名称: 法令番号}の作成
     for law in laws_elem.findall("law"):  # loop over <law> elements
@@ -44,32 +74,70 @@ def get_lawid_from_lawtitle(
         law_num: str = law_info.findtext("law_num", default="(no number)")
         lawtitle: str = revision_info.findtext("law_title", default="(no title)")
 
-        print(f"ID: {law_id}, Num: {law_num}, Title: {lawtitle}")
+        if debug_enabled:
+            logger.debug("ID: %s, Num: %s, Title: %s", law_id, law_num, lawtitle)
         law_dict[lawtitle] = law_id
-    print(f"Number of laws: {counter}")
+    logger.debug("Number of laws: %d", counter)
     if if_exact:
         return law_dict[law_title]  # allow exact match
     return law_dict  # return all matches
 
 
+@disk_cached
 def get_lawdata_from_law_id(law_id: str, output_type: Literal["xml", "list"]):
     """法令IDから法令データを取得"""
     url = f"https://laws.e-gov.go.jp/api/2/law_data/{law_id}"
-    r = requests.get(url, params={"response_format": "xml"})
+    r = _SESSION.get(url, params={"response_format": "xml"}, timeout=REQUEST_TIMEOUT)
     if r.status_code != 200:
-        print(f"Error fetching law data for ID {law_id}: {r.status_code}")
+        logger.error("Error fetching law data for ID %s: %s", law_id, r.status_code)
         return None
     if output_type == "xml":
         return r.content.decode(encoding="utf-8")
 
     if output_type == "list":
-        # XMLデータの解析
-        root = ElementTree.fromstring(r.content.decode(encoding="utf-8"))
-        contents = [e.text.strip() for e in root.iter() if e.text]
-        return [t for t in contents if t]
+        # XMLデータを逐次解析してテキストだけを取り出す
+        return list(_iter_text(r.content))
     raise ValueError(f"Supported output type is xml or list. Got {output_type}")
 
 
+def _iter_text(xml_bytes: bytes) -> Iterator[str]:
+    """XMLを逐次パースし，各要素のテキスト(前後の空白を除いて空でないもの)を文書順に返す
+
+    処理済みの要素はその場で解放するので，文書全体の木をメモリに保持しない．
+    """
+    pending = None  # 開始タグを読んだが，まだtextを返していない要素
+    for event, elem in ElementTree.iterparse(
+        BytesIO(xml_bytes), events=("start", "end")
+    ):
+        # 子要素の開始または自身の終了の時点で，pendingのtextは確定している
+        if pending is not None:
+            text = pending.text.strip() if pending.text else ""
+            if text:
+                yield text
+            pending = None
+
+        if event == "start":
+            pending = elem
+            continue
+
+        elem.clear()
+        if HAS_LXML:
+            # 処理済みの兄弟要素を親から外す
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def get_lawdata_batch(
+    law_ids: List[str],
+    output_type: Literal["xml", "list"] = "xml",
+    *,
+    max_workers: int = 8,
+) -> list:
+    """複数の法令IDから法令データを並行して取得(結果はlaw_idsと同じ順番)"""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_lawdata_from_law_id, law_ids, repeat(output_type)))
+
+
 def get_lawdata_from_lawname(law_name: str) -> str:
     """法令名から法令データを取得(完全一致のみ)"""
     law_id = get_lawid_from_lawtitle(law_name, if_exact=True)
@@ -84,9 +152,14 @@ def save_xml_string_to_file(xml_string: str, filename: str):
         f.write(xml_string)
 
 
-def extract_sections_from_xml(xml_string: str) -> Dict[str, str | None | list[str]]:
-    """TOC, MainProvision,SupplProvisionの3つを取得"""
-    root = ElementTree.fromstring(xml_string)
+def extract_law_body(xml: str | bytes) -> Any:
+    """law_full_text/Law/LawBody要素を取得"""
+    root = fromstring(xml)
+
+    # 通常はパス一つで見つかる．見つからない場合のみ，どの階層が欠けているかを調べる
+    law_body = root.find("law_full_text/Law/LawBody")
+    if law_body is not None:
+        return law_body
 
     # law_infoタグを取得
     law_full_text = root.find("law_full_text")
@@ -101,11 +174,42 @@ def extract_sections_from_xml(xml_string: str) -> Dict[str, str | None | list[st
     law_body = law.find("LawBody")
     if law_body is None:
         raise ValueError("<LawBody> タグが <Law> 内に見つかりません")
+    return law_body
+
+
+def extract_section_elements(xml: str | bytes) -> Dict[str, Any]:
+    """TOC, MainProvision,SupplProvisionの3つを要素のまま取得
+
+    文字列への再シリアライズを行わないので，各パーサーに要素をそのまま渡せる．
+    """
+    law_body = extract_law_body(xml)
+
+    # 対象の3つのタグを，LawBodyの子要素を一度だけ走査して取得
+    toc = main_prov = None
+    suppl_provs = []
+    for child in law_body:
+        if child.tag == "TOC" and toc is None:
+            toc = child
+        elif child.tag == "MainProvision" and main_prov is None:
+            main_prov = child
+        elif child.tag == "SupplProvision":
+            suppl_provs.append(child)
+
+    return {
+        "TOC": toc,
+        "MainProvision": main_prov,
+        "SupplProvision": suppl_provs if suppl_provs else None,
+    }
+
 
-    # 対象の3つのタグを取得
-    toc = law_body.find("TOC")
-    main_prov = law_body.find("MainProvision")
-    suppl_provs = law_body.findall("SupplProvision")
+def extract_sections_from_xml(
+    xml_string: str | bytes,
+) -> Dict[str, str | None | list[str]]:
+    """TOC, MainProvision,SupplProvisionの3つを文字列で取得(後方互換のため)"""
+    sections = extract_section_elements(xml_string)
+    toc = sections["TOC"]
+    main_prov = sections["MainProvision"]
+    suppl_provs = sections["SupplProvision"]
 
     return {
         "TOC": (
@@ -116,11 +220,6 @@ def extract_sections_from_xml(xml_string: str) -> Dict[str, str | None | list[st
             if main_prov is not None
             else None
         ),
-        # "SupplProvision": (
-        #     ElementTree.tostring(suppl_prov, encoding="unicode")
-        #     if suppl_prov is not None
-        #     else None
-        # ),
         "SupplProvision": (
             [ElementTree.tostring(s, encoding="unicode") for s in suppl_provs]
             if suppl_provs
@@ -1,29 +1,43 @@
 from __future__ import annotations
 
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional, Type
-from xml.etree import ElementTree
-
-from elaws_parser.api.hourei_apiv2 import extract_sections_from_xml
-
-
-def parse_toc_to_text(toc_xml: str | None) -> str:
-    """XML文字列をパース"""
-    if toc_xml is None:
-        return ""
-
-    toc_elem = ElementTree.fromstring(toc_xml)
-
-    # 出力用リスト
-    lines = []
+from typing import Iterable, Iterator, List, Optional, Type
+
+from elaws_parser.api.hourei_apiv2 import extract_law_body
+from elaws_parser.utils.parallel import _map_in_process_pool
+from elaws_parser.utils.xml_utils import (
+    Element,
+    ParseError,
+    as_element,
+    extract_sentence_text,
+)
+
+logger = logging.getLogger(__name__)
+
+# Subitemタグ名 → 階層レベル（法令XMLのスキーマではSubitem1〜Subitem10）
+_SUBITEM_LEVELS = {f"Subitem{i}": i for i in range(1, 11)}
+
+
+def _append_toc_lines(toc, lines: List[str]) -> None:
+    """TOC要素の内容をlinesに追加する"""
+    # TOCの子要素を一度だけ走査して振り分ける
+    label = suppl = None
+    chapters = []
+    for child in toc:
+        if child.tag == "TOCLabel" and label is None:
+            label = child
+        elif child.tag == "TOCChapter":
+            chapters.append(child)
+        elif child.tag == "TOCSupplProvision" and suppl is None:
+            suppl = child
 
     # TOCLabel を追加
-    label = toc_elem.find("TOCLabel")
     if label is not None and label.text:
         lines.append(label.text.strip())
 
     # TOCChapter を順に処理
-    for chapter in toc_elem.findall("TOCChapter"):
+    for chapter in chapters:
         title = chapter.find("ChapterTitle")
         article_range = chapter.find("ArticleRange")
         if (
@@ -36,22 +50,71 @@ def parse_toc_to_text(toc_xml: str | None) -> str:
             lines.append(line)
 
     # TOCSupplProvision のラベル（附則）を追加
-    suppl = toc_elem.find("TOCSupplProvision")
     if suppl is not None:
         suppl_label = suppl.find("SupplProvisionLabel")
         if suppl_label is not None and suppl_label.text:
             lines.append(suppl_label.text.strip())
 
+
+def _append_supplprovision_lines(suppl, lines: List[str]) -> None:
+    """SupplProvision要素の内容をlinesに追加する
+
+    (Paragraph->ParagraphCaption, ParagraphNum, Sentence)
+    """
+    for para in suppl.iter("Paragraph"):
+        # 見出し（段落キャプション）があれば取得
+        caption = para.findtext("ParagraphCaption")
+        if caption:
+            lines.append(f"（{caption.strip('（）')}）")
+
+        # 段落番号
+        para_num = para.findtext("ParagraphNum")
+        prefix = f"{para_num}　" if para_num else ""
+
+        # センテンスをすべて「。」で連結し，段落番号と合わせて一度に組み立てる
+        parts = [s.text.strip().strip("。") for s in para.iter("Sentence") if s.text]
+        lines.append(f"{prefix}{'。'.join(parts)}。" if parts else prefix)
+
+
+def parse_toc_to_text(toc_xml: str | Element | None) -> str:
+    """TOCのXML(文字列またはパース済み要素)をテキストに変換"""
+    if toc_xml is None:
+        return ""
+
+    lines: List[str] = []
+    _append_toc_lines(as_element(toc_xml), lines)
     return "\n".join(lines)
 
 
 class BaseLawParser(ABC):
     """法令XMLパーサーの基底クラス"""
 
-    def __init__(self, xml: str):
-        self.root = ElementTree.fromstring(xml)
+    def __init__(self, xml: str | bytes | Element):
+        self.root = as_element(xml)
         self.lines: List[str] = []
 
+        # 子要素のタグ → 処理メソッドの対応表（編・章・節・款）
+        self._part_handlers = {
+            "PartTitle": self._process_title,
+            "Chapter": self._process_chapter,
+            "Section": self._process_section,
+            "Article": self._process_article,
+        }
+        self._chapter_handlers = {
+            "ChapterTitle": self._process_title,
+            "Section": self._process_section,
+            "Article": self._process_article,
+        }
+        self._section_handlers = {
+            "SectionTitle": self._process_title,
+            "Subsection": self._process_subsection,
+            "Article": self._process_article,
+        }
+        self._subsection_handlers = {
+            "SubsectionTitle": self._process_title,
+            "Article": self._process_article,
+        }
+
     def parse(self) -> str:
         """XMLをテキストに変換する（Template Method）"""
         self._setup()
@@ -71,196 +134,247 @@ class BaseLawParser(ABC):
         """トップレベル要素を処理する（子クラスで実装）"""
         pass
 
+    def _process_main_provision(self, main_provision) -> None:
+        """本則を処理する（直下のPart, Chapter, Articleのうち最初に見つかった構造で処理）"""
+        if main_provision.find("Part") is not None:
+            for part in main_provision.findall("Part"):
+                self._process_part(part)
+        elif main_provision.find("Chapter") is not None:
+            for chapter in main_provision.findall("Chapter"):
+                self._process_chapter(chapter)
+        elif main_provision.find("Article") is not None:
+            for article in main_provision.findall("Article"):
+                self._process_article(article)
+        else:
+            raise ValueError(
+                "Unknown XML structure: neither Chapter nor Article found at root level"
+            )
+
+    def _process_part(self, part) -> None:
+        """編(part)を処理する"""
+        # Part直下の全ての子要素を順番通りに処理
+        self._dispatch_children(part, self._part_handlers)
+
     def _process_chapter(self, chapter) -> None:
         """章を処理する"""
-        chapter_title = chapter.findtext("ChapterTitle")
-        if chapter_title:
-            self._add_line(chapter_title)
-            self._add_blank_line()
-
         # Chapter直下の全ての子要素を順番通りに処理
-        for child in chapter:
-            if child.tag == "Section":
-                self._process_section(child)
-            elif child.tag == "Article":
-                self._process_article(child)
+        self._dispatch_children(chapter, self._chapter_handlers)
 
     def _process_section(self, section) -> None:
         """節を処理する"""
-        section_title = section.findtext("SectionTitle")
-        if section_title:
-            self._add_line(section_title)
-            self._add_blank_line()
-
-        # Chapter直下の全ての子要素を順番通りに処理
-        for child in section:
-            if child.tag == "Subsection":
-                self._process_subsection(child)
-            elif child.tag == "Article":
-                self._process_article(child)
+        # Section直下の全ての子要素を順番通りに処理
+        self._dispatch_children(section, self._section_handlers)
 
     def _process_subsection(self, subsection) -> None:
         """節を処理する"""
-        subsection_title = subsection.findtext("SubsectionTitle")
-        if subsection_title:
-            self._add_line(subsection_title)
-            self._add_blank_line()
+        self._dispatch_children(subsection, self._subsection_handlers)
 
-        for article in subsection.findall("Article"):
-            self._process_article(article)
+    @staticmethod
+    def _dispatch_children(element, handlers) -> None:
+        """子要素を順番に，タグに対応するハンドラーで処理する（対応がなければ無視）"""
+        for child in element:
+            handler = handlers.get(child.tag)
+            if handler is not None:
+                handler(child)
+
+    def _process_title(self, title) -> None:
+        """編・章・節などのタイトル要素を見出しとして追加する"""
+        self._add_heading(title.text)
 
     def _process_article(self, article) -> None:
         """条を処理する"""
-        self._add_optional_text(article.findtext("ArticleCaption"))
-        self._add_optional_text(article.findtext("ArticleTitle"))
+        # 子要素を一度だけ走査して振り分ける
+        caption = title = None
+        paragraphs = []
+        for child in article:
+            tag = child.tag
+            if tag == "ArticleCaption":
+                caption = child.text
+            elif tag == "ArticleTitle":
+                title = child.text
+            elif tag == "Paragraph":
+                paragraphs.append(child)
+
+        append = self.lines.append
+        if caption:
+            append(caption.strip())
+        if title:
+            append(title.strip())
 
-        for paragraph in article.findall("Paragraph"):
-            self._process_paragraph(paragraph)
+        process_paragraph = self._process_paragraph
+        for paragraph in paragraphs:
+            process_paragraph(paragraph)
 
     def _process_paragraph(self, paragraph) -> None:
         """項を処理する"""
-        self._add_optional_text(paragraph.findtext("ParagraphNum"))
-
-        # 段落の文を処理(ParagraphSentenceは常に一つのみで存在するためfindallではなくfindを使用)
-        paragraph_sentence = paragraph.find("ParagraphSentence")
+        para_num = paragraph_sentence = None
+        items = []
+        table_structs = []
+        for child in paragraph:
+            tag = child.tag
+            if tag == "ParagraphNum":
+                para_num = child.text
+            elif tag == "ParagraphSentence":
+                paragraph_sentence = child
+            elif tag == "Item":
+                items.append(child)
+            elif tag == "TableStruct":
+                table_structs.append(child)
+
+        if para_num:
+            self.lines.append(para_num.strip())
+
+        # 段落の文を処理
         if paragraph_sentence is not None:
             self._process_sentences(paragraph_sentence)
 
         # 項目を処理
-        for item in paragraph.findall("Item"):
-            self._process_item(item)
+        process_item = self._process_item
+        for item in items:
+            process_item(item)
 
-        # Tableがあれば処理
-        table_struct = paragraph.find("TableStruct")
-        if table_struct is not None:
-            print("Processing TableStruct in Paragraph")
+        # Tableがあれば文書順に全て処理
+        for table_struct in table_structs:
+            logger.debug("Processing TableStruct in Paragraph")
             self._parse_table_struct(table_struct)
 
     def _process_item(self, item) -> None:
         """項目を処理する（子クラスでオーバーライド可能）"""
-        self._add_optional_text(item.findtext("ItemTitle"))
+        item_title = item_sentence = None
+        subitems = []
+        table_structs = []
+        for child in item:
+            tag = child.tag
+            if tag == "ItemTitle":
+                item_title = child.text
+            elif tag == "ItemSentence":
+                item_sentence = child
+            elif tag == "TableStruct":
+                table_structs.append(child)
+            elif tag == "Subitem1":
+                subitems.append(child)
+
+        if item_title:
+            self.lines.append(item_title.strip())
 
-        item_sentence = item.find("ItemSentence")
         if item_sentence is not None:
             self._process_item_sentence(item_sentence)
 
-        # Tableがあれば処理
-        table_struct = item.find("TableStruct")
-        if table_struct is not None:
-            print("Processing TableStruct in Item")
+        # Tableがあれば文書順に全て処理
+        for table_struct in table_structs:
+            logger.debug("Processing TableStruct in Item")
             self._parse_table_struct(table_struct)
 
         # Subitem1要素を処理（再帰的にネストされたSubitemも処理）
-        for subitem in item.findall("Subitem1"):
-            self._process_subitem(subitem)
+        process_subitem = self._process_subitem
+        for subitem in subitems:
+            process_subitem(subitem)
 
     def _process_item_sentence(self, item_sentence) -> None:
         """ItemSentenceを処理する（基本実装、子クラスでオーバーライド可能）"""
         self._process_sentences(item_sentence)
 
     def _process_subitem(self, subitem) -> None:
-        """サブ項目を処理する（再帰的にネストされたSubitemを処理）"""
-        # Subitemのレベルを動的に判定
-        tag_name = subitem.tag
-        level = self._extract_subitem_level(tag_name)
-
-        # タイトルを処理
-        title_tag = f"{tag_name}Title"
-        self._add_optional_text(subitem.findtext(title_tag))
-        # print(f"Processing {tag_name} at level {level} with {title_tag}")
-
-        # 文章を処理
-        sentence_tag = f"{tag_name}Sentence"
-        subitem_sentence = subitem.find(sentence_tag)
-        if subitem_sentence is not None:
-            self._process_sentences(subitem_sentence)
-
-        # Tableがあれば処理
-        table_struct = subitem.find("TableStruct")
-        if table_struct is not None:
-            print("Processing TableStruct in SubItem")
-            self._parse_table_struct(table_struct)
-
-        # 次のレベルのSubitemを再帰的に処理
-        next_level = level + 1
-        next_subitem_tag = f"Subitem{next_level}"
-        for next_subitem in subitem.findall(next_subitem_tag):
-            self._process_subitem(next_subitem)
+        """サブ項目を処理する（ネストされたSubitemも，再帰せずスタックで順に処理）"""
+        stack = [subitem]
+        while stack:
+            current = stack.pop()
+
+            # Subitemのレベルを動的に判定
+            tag_name = current.tag
+            level = self._extract_subitem_level(tag_name)
+            title_tag = f"{tag_name}Title"
+            sentence_tag = f"{tag_name}Sentence"
+            next_subitem_tag = f"Subitem{level + 1}"
+
+            title = subitem_sentence = None
+            next_subitems = []
+            table_structs = []
+            for child in current:
+                tag = child.tag
+                if tag == title_tag:
+                    title = child.text
+                elif tag == sentence_tag:
+                    subitem_sentence = child
+                elif tag == "TableStruct":
+                    table_structs.append(child)
+                elif tag == next_subitem_tag:
+                    next_subitems.append(child)
+
+            # タイトルを処理
+            self._add_optional_text(title)
+
+            # 文章を処理
+            if subitem_sentence is not None:
+                self._process_sentences(subitem_sentence)
+
+            # Tableがあれば文書順に全て処理
+            for table_struct in table_structs:
+                logger.debug("Processing TableStruct in SubItem")
+                self._parse_table_struct(table_struct)
+
+            # 次のレベルのSubitemは，文書順に処理されるよう逆順に積む
+            stack.extend(reversed(next_subitems))
 
     def _extract_subitem_level(self, tag_name: str) -> int:
         """SubitemタグからレベルNumberを抽出する（例: "Subitem1" → 1）"""
-        import re
+        return _SUBITEM_LEVELS.get(tag_name, 1)
 
-        match = re.search(r"Subitem(\d+)", tag_name)
-        return int(match.group(1)) if match else 1
+    @staticmethod
+    def _iter_sentences(sentence_container) -> Iterator:
+        """文のコンテナ内のSentenceを文書順に返す(".//Sentence"と同じ結果)
+
+        大半の文はコンテナ直下のSentenceなので，それはそのまま返す．
+        Column，およびItemSentenceやSubitem*Sentenceの中のTableなど
+        それ以外の子要素は，その子孫のSentenceをたどる．
+        """
+        for child in sentence_container:
+            if child.tag == "Sentence":
+                yield child
+            else:
+                yield from child.iter("Sentence")
 
     def _process_sentences(self, sentence_container) -> None:
         """文のコンテナを処理する"""
-        for sentence in sentence_container.findall(".//Sentence"):
-            sentence_text = self._extract_sentence_text(sentence)
+        # 文ごとに呼ばれるメソッドはローカル変数に束縛しておく
+        # (extract_sentence_textは前後の空白を除いた文字列を返すので，そのまま追加できる)
+        append = self.lines.append
+        extract = extract_sentence_text
+        for sentence in self._iter_sentences(sentence_container):
+            sentence_text = extract(sentence)
             if sentence_text:
-                self._add_line(sentence_text)
-
-    def _extract_sentence_text(self, sentence) -> str:
-        """文要素からテキストを抽出（ルビ対応）"""
-
-        def process_element(elem):
-            """要素を再帰的に処理してテキストを抽出"""
-            text_parts = []
-
-            # 要素のテキスト（開始タグ直後のテキスト）
-            if elem.text:
-                text_parts.append(elem.text)
-
-            # 子要素を処理
-            for child in elem:
-                if child.tag == "Ruby":
-                    # Ruby要素の場合は特別処理
-                    text_parts.append(self._get_ruby_text(child))
-                else:
-                    # その他の子要素は再帰処理
-                    text_parts.append(process_element(child))
-
-                # 子要素の後のテキスト（tail）
-                if child.tail:
-                    text_parts.append(child.tail)
-
-            return "".join(text_parts)
-
-        return process_element(sentence).strip()
-
-    def _get_ruby_text(self, element) -> str:
-        """ルビ要素を処理する: <Ruby>漢字<Rt>読み</Rt></Ruby> → 漢字（読み）"""
-        rt_element = element.find("Rt")
-        if rt_element is not None and element.text:
-            return f"{element.text}（{rt_element.text}）"
-
-        # フォールバック: 全てのテキストを結合
-        return "".join(element.itertext())
+                append(sentence_text)
 
     def _parse_table_struct(self, table_struct):
         """<TableStruct>をパース
         テーブルは独立した構造を持つため，一旦パースして最後にadd_lineで追加する
         """
-        table_struct = table_struct.find("Table")
-        for row in table_struct.findall(".//TableRow"):  # 行の処理
-            cols = []
-            for col in row.findall("TableColumn"):
-                sentences = [
-                    self._extract_sentence_text(s) for s in col.findall("Sentence")
-                ]
-                cols.append(" ".join(sentences))
+        table = table_struct.find("Table")
+        if table is None:
+            return
+
+        extract = extract_sentence_text
+        for row in table.iter("TableRow"):  # 行の処理
+            # セルには列の直下のSentenceだけを含める(col.findall("Sentence")と同じ)
+            cols = [
+                " ".join([extract(s) for s in col if s.tag == "Sentence"])
+                for col in row
+                if col.tag == "TableColumn"
+            ]
             if cols:
-                # print("table =", "|" + " | ".join(cols) + "|")
-                self._add_line(
-                    "|" + " | ".join(cols) + "|"
-                )  # |区切りでmarkdown風に結合
+                self._add_line(f"|{' | '.join(cols)}|")  # |区切りでmarkdown風に結合
 
     def _add_optional_text(self, text: Optional[str]) -> None:
         """テキストがある場合のみ行に追加する"""
         if text:
             self._add_line(text)
 
+    def _add_heading(self, text: Optional[str]) -> None:
+        """見出し（章・節などのタイトル）がある場合のみ，行と空行を追加する"""
+        if text:
+            self._add_line(text)
+            self._add_blank_line()
+
     def _add_line(self, text: str) -> None:
         """行を追加する（空白をトリム）"""
         self.lines.append(text.strip())
@@ -278,22 +392,6 @@ class PartBasedParser(BaseLawParser):
         for part in self.root.findall("Part"):
             self._process_part(part)
 
-    def _process_part(self, part) -> None:
-        """編(part)を処理する"""
-        part_title = part.findtext("PartTitle")
-        if part_title:
-            self._add_line(part_title)
-            self._add_blank_line()
-
-        # Chapter直下の全ての子要素を順番通りに処理
-        for child in part:
-            if child.tag == "Chapter":
-                self._process_chapter(child)
-            if child.tag == "Section":
-                self._process_section(child)
-            elif child.tag == "Article":
-                self._process_article(child)
-
 
 class ChapterBasedParser(BaseLawParser):
     """Chapter構造の法令XMLパーサー"""
@@ -312,117 +410,121 @@ class ArticleBasedParser(BaseLawParser):
         for article in self.root.findall("Article"):
             self._process_article(article)
 
-    def _process_item_sentence(self, item_sentence) -> None:
-        """ItemSentenceを処理する（Column要素対応版）"""
-        # Column要素がある場合はColumn経由で処理
-        columns = item_sentence.findall("Column")
-        if columns:
-            for column in columns:
-                self._process_sentences(column)
-        else:
-            # Column要素がない場合は直接処理
-            self._process_sentences(item_sentence)
+
+class FullLawParser(BaseLawParser):
+    """LawBody全体（目次・本則・附則）を一度の走査でテキストに変換するパーサー"""
+
+    def _setup(self) -> None:
+        """初期化処理"""
+        super()._setup()
+        # 目次・本則・附則ごとの行リスト
+        self._sections: List[List[str]] = []
+
+    def _start_section(self) -> None:
+        """新しい部分(目次・本則・附則)の行リストに切り替える"""
+        self.lines = []
+        self._sections.append(self.lines)
+
+    def _process_top_level_elements(self) -> None:
+        """LawBody直下のTOC, MainProvision, SupplProvisionを処理する"""
+        has_main_provision = has_suppl_provision = False
+        for child in self.root:
+            if child.tag == "TOC":
+                self._start_section()
+                _append_toc_lines(child, self.lines)
+            elif child.tag == "MainProvision":
+                has_main_provision = True
+                self._start_section()
+                self._process_main_provision(child)
+            elif child.tag == "SupplProvision" and not has_suppl_provision:
+                # 附則は最初のSupplProvisionのみを出力する
+                has_suppl_provision = True
+                self._start_section()
+                _append_supplprovision_lines(child, self.lines)
+
+        if not has_main_provision:
+            raise ValueError("<MainProvision> タグが <LawBody> 内に見つかりません")
+
+    def _finalize(self) -> str:
+        """最終処理（従来の出力に合わせ，各部分は改行を挟まずに連結する）"""
+        return "".join("\n".join(lines) for lines in self._sections)
 
 
 class LawXmlParser:
     """法令XMLパーサーのファクトリクラス"""
 
     @staticmethod
-    def _detect_parser_type(xml: str) -> Type[BaseLawParser]:
-        """XMLの構造を検出して適切なパーサータイプを返す"""
+    def _to_element(xml: str | Element) -> Element:
+        """XML文字列をパースする（パース済みの要素はそのまま返す）"""
         try:
-            root = ElementTree.fromstring(xml)
-
-            # Part要素があるかチェック
-            if root.find("Part") is not None:
-                return PartBasedParser
-            # Chapter要素があるかチェック
-            elif root.find("Chapter") is not None:
-                return ChapterBasedParser
-            # Article要素があるかチェック
-            elif root.find("Article") is not None:
-                return ArticleBasedParser
-            else:
-                raise ValueError(
-                    "Unknown XML structure: "
-                    "neither Chapter nor Article found at root level"
-                )
-
-        except ElementTree.ParseError as e:
+            return as_element(xml)
+        except ParseError as e:
             raise ValueError(f"Invalid XML format: {e}")
 
     @classmethod
-    def parse(cls, xml: str) -> str:
+    def _detect_parser_type(cls, xml: str | Element) -> Type[BaseLawParser]:
+        """XMLの構造を検出して適切なパーサータイプを返す"""
+        root = cls._to_element(xml)
+
+        # Part要素があるかチェック
+        if root.find("Part") is not None:
+            return PartBasedParser
+        # Chapter要素があるかチェック
+        elif root.find("Chapter") is not None:
+            return ChapterBasedParser
+        # Article要素があるかチェック
+        elif root.find("Article") is not None:
+            return ArticleBasedParser
+        else:
+            raise ValueError(
+                "Unknown XML structure: "
+                "neither Chapter nor Article found at root level"
+            )
+
+    @classmethod
+    def parse(cls, xml: str | Element) -> str:
         """XMLを自動検出してテキストに変換する"""
-        parser_class = cls._detect_parser_type(xml)
-        parser = parser_class(xml)
+        # 文字列は一度だけパースし，構造の判定とパーサーで同じ要素を使う
+        root = cls._to_element(xml)
+        parser_class = cls._detect_parser_type(root)
+        parser = parser_class(root)
         return parser.parse()
 
 
-def parse_mainprovision_to_text(xml: str) -> str:
+def parse_mainprovision_to_text(xml: str | Element) -> str:
     """MainProvisionを処理する（後方互換性のため）
     LawXmlParser.parseを呼び出すため，法令，施行規則の両方に対応
     """
     return LawXmlParser.parse(xml)
 
 
-def parse_supplprovision_to_text(xml_string: str):
+def parse_supplprovision_to_text(xml_string: str | Element):
     """SupplProvisionのxmlを処理する(Paragraph->ParagraphCaption, ParagraphNum, Sentence)"""
-    root = ElementTree.fromstring(xml_string)
-    output = []
+    lines: List[str] = []
+    _append_supplprovision_lines(as_element(xml_string), lines)
+    return "\n".join(lines)
 
-    for para in root.findall(".//Paragraph"):
-        # 見出し（段落キャプション）があれば取得
-        caption = para.findtext("ParagraphCaption")
-        if caption:
-            output.append(f"（{caption.strip('（）')}）")
 
-        # 段落番号
-        para_num = para.findtext("ParagraphNum")
-        line = f"{para_num}　" if para_num else ""
+def convert_xml_to_text(xml_string: str | bytes) -> str:
+    """
+    通常の法令(Chapter始まり)と，施行規則(Article始まり)の二つに対応
+    目次・本則・附則はFullLawParserでLawBodyを一度走査して変換する
+    """
+    return FullLawParser(extract_law_body(xml_string)).parse()
 
-        # センテンスをすべて連結
-        sentences = para.findall(".//Sentence")
-        sentence_texts = [s.text.strip() for s in sentences if s.text]
-        line += (
-            "。".join(s.strip("。") for s in sentence_texts) + "。"
-            if sentence_texts
-            else ""
-        )
 
-        # 出力に追加
-        output.append(line)
+def convert_laws_to_text(
+    xml_strings: Iterable[str | bytes], workers: Optional[int] = None
+) -> List[str]:
+    """複数の法令XMLをプロセスプールで並列にテキストへ変換する
 
-    return "\n".join(output)
+    法令ごとに独立してパースするため，プロセスを分けることでGILの影響を受けずに全コアを使える．
 
+    Args:
+        xml_strings: 法令のXML文字列
+        workers: ワーカープロセス数（Noneの場合はCPU数）
 
-def convert_xml_to_text(xml_string: str) -> str:
-    """
-    通常の法令(Chapter始まり)と，施行規則(Article始まり)の二つに対応
-    #TODO:: TOCのパターンの処理はもう少しスマートにできない？
+    Returns:
+        変換後のテキスト（xml_stringsと同じ順番）
     """
-    sections = extract_sections_from_xml(xml_string)
-    toc_xml = sections["TOC"]
-    main_xml = sections["MainProvision"]
-    suppl_xml_list = sections["SupplProvision"]
-
-    assert main_xml is not None and isinstance(main_xml, str)
-
-    toc_text = ""
-    if toc_xml is not None:
-        assert isinstance(toc_xml, str)
-        toc_text = parse_toc_to_text(toc_xml)
-
-    main_text = LawXmlParser.parse(main_xml)
-
-    suppl_text = ""
-    if suppl_xml_list is not None:
-        assert isinstance(suppl_xml_list, list)
-        if len(suppl_xml_list) > 0:
-            suppl_xml = suppl_xml_list[0]
-            assert isinstance(suppl_xml, str)
-            suppl_text = parse_supplprovision_to_text(suppl_xml)
-
-    if toc_xml is not None:
-        return toc_text + main_text + suppl_text
-    return main_text + suppl_text
+    return _map_in_process_pool(convert_xml_to_text, xml_strings, workers)
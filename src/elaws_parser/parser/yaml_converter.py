@@ -1,144 +1,303 @@
 """
 yaml形式でのxmlからの抽出
 
-# TODO :: textパーサーと合わせて，重複部分を上位クラスに定義する
+# TODO :: textパーサーと合わせて，重複部分を上位クラスに定義する(文のテキスト抽出はxml_utilsで共通化済み)
 """
 
+from __future__ import annotations
+
+import hashlib
+import io
 import re
-from typing import Any, Dict, Optional
-from xml.etree import ElementTree
+import threading
+from collections import OrderedDict, deque
+from typing import IO, Any, Dict, Iterable, List, Optional
 
 import yaml
 
+from elaws_parser.utils.kanji import kanji_to_int
+from elaws_parser.utils.parallel import _map_in_process_pool
+from elaws_parser.utils.xml_utils import extract_sentence_text, iterparse, release
+
+try:
+    # libyamlが使えればC実装のダンパーで出力する
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+
+
+class _YamlDumper(_Dumper):
+    """_ArticleDataを辞書として書き出すダンパー(yaml全体の設定を汚さないよう派生させる)"""
+
+
+# 逐次パースで拾う要素．law_title以外はLawBody直下のものだけを処理する
+_STREAM_TAGS = ("law_title", "LawNum", "TOC", "MainProvision", "SupplProvision")
+
+# サブ項目(Subitem1〜Subitem10)のタグ名．階層levelのものを[level]で引けるよう，
+# 先頭(0番目)は空文字列にしておく
+_SUBITEM_MAX_LEVEL = 10
+_SUBITEM_TAGS = ("",) + tuple(f"Subitem{i}" for i in range(1, _SUBITEM_MAX_LEVEL + 1))
+_SUBITEM_TITLE_TAGS = ("",) + tuple(
+    f"Subitem{i}Title" for i in range(1, _SUBITEM_MAX_LEVEL + 1)
+)
+_SUBITEM_SENTENCE_TAGS = ("",) + tuple(
+    f"Subitem{i}Sentence" for i in range(1, _SUBITEM_MAX_LEVEL + 1)
+)
+
+# _process_paragraphが個別に処理する項の子要素(附則の項では，これ以外の子要素の文もcontentに含める)
+_PARAGRAPH_HANDLED_TAGS = frozenset(
+    ("ParagraphCaption", "ParagraphNum", "ParagraphSentence", "Item", "TableStruct")
+)
+
+# タイトル(第X章など)と項番号・号番号から番号を取り出す正規表現
+_TITLE_NUM_RE = re.compile(r"第([一二三四五六七八九十百千万壱弐参拾]+|[0-9]+)")
+_DIGIT_RE = re.compile(r"([0-9]+)")
+
+
+def _child_elements(elem, tag: str) -> List[Any]:
+    """elemの直下にあるtagの要素をリストで返す(findall(tag)と同じ結果)
+
+    タグ名1つの探索ではXPath(findall，etree.XPath)を介するより，
+    子要素を直接走査してタグを比べる方が速い．
+    """
+    return [child for child in elem if child.tag == tag]
+
+
+def _split_children(elem, *tags: str) -> List[List[Any]]:
+    """elemの子要素を1回だけ走査し，tagsの順にそれぞれのタグの要素のリストを返す"""
+    found: Dict[str, List[Any]] = {tag: [] for tag in tags}
+    for child in elem:
+        bucket = found.get(child.tag)
+        if bucket is not None:
+            bucket.append(child)
+    return [found[tag] for tag in tags]
+
+
+class _ArticleData:
+    """条の中間表現
+
+    条は法令中で最も数が多いノードなので，辞書ではなく__slots__のオブジェクトで保持し，
+    YAMLへの出力時(またはconvert()の戻り値を作るとき)に辞書に直す．
+    値がNoneの属性は出力しない．
+    """
+
+    __slots__ = ("caption", "title", "article_num", "paragraphs")
+
+    def __init__(self) -> None:
+        self.caption: Optional[str] = None
+        self.title: Optional[str] = None
+        self.article_num: Optional[str] = None
+        self.paragraphs: Optional[List[Dict[str, Any]]] = None
+
+    def __bool__(self) -> bool:
+        return (
+            self.caption is not None
+            or self.title is not None
+            or self.article_num is not None
+            or self.paragraphs is not None
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """値がある属性だけを，出力順の辞書にする"""
+        result: Dict[str, Any] = {}
+        for key in self.__slots__:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value
+        return result
+
+
+def _represent_article(dumper, article: _ArticleData):
+    return dumper.represent_dict(article.to_dict())
+
+
+_YamlDumper.add_representer(_ArticleData, _represent_article)
+
+
+def _to_plain(value: Any) -> Any:
+    """_ArticleDataを含むデータ構造を，辞書とリストだけのものに直す"""
+    if isinstance(value, _ArticleData):
+        # 条の中(項・号)に条が入ることはないので，それ以上はたどらない
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    return value
+
 
 class LawToYamlConverter:
     """法令XMLをYAML形式に変換するコンバータークラス"""
 
-    def __init__(self, xml_string: str):
+    def __init__(self, source: str | bytes | IO[bytes]):
         """
         Args:
-            xml_string: 法令のXML文字列
+            source: 法令のXML文字列，またはXMLを読み出せるバイナリファイル
+                (ファイルの場合，convert()は1回しか呼べない)
         """
-        self.root = ElementTree.fromstring(xml_string)
+        self.source = source
         self.yaml_data: Dict[str, Any] = {}
+        # _build()が組み立て中のデータ構造(条は_ArticleDataのまま)．
+        # 公開するself.yaml_dataには必ず_to_plain()した辞書を入れる
+        self._data: Dict[str, Any] = {}
+        # 最初に見つけたLawBody要素．以降はタグ名ではなく同一性で親を判定する
+        self._law_body: Any = None
+        # 処理中の本則・附則に表やサブ項目が含まれるか(_inspect_shapeで設定する)．
+        # 含まれなければ項・号ごとのTableStructやSubitem1の探索を省く
+        self._has_tables = True
+        self._has_subitems = True
 
     def convert(self) -> Dict[str, Any]:
-        """XML(self.root)をYAMLデータ構造に変換
+        """XML(self.source)をYAMLデータ構造に変換
 
         Returns:
             YAML形式のデータ構造（辞書）
         """
-        self._extract_law_info()
-        self._extract_toc()
-        self._extract_main_provisions()
-        self._extract_supplementary_provisions()
+        self.yaml_data = _to_plain(self._build())
         return self.yaml_data
 
+    def _build(self) -> Dict[str, Any]:
+        """XML(self.source)からYAMLデータ構造を作る(条は_ArticleDataのまま)
+
+        iterparseで1回だけ読み進め，LawBody直下の目次・本則・附則が閉じるたびに
+        その部分木を処理して木から外す．これにより巨大な法令でも木全体を保持しない．
+        """
+        self._data = {}
+        self._law_body = None
+        law_info: Dict[str, Any] = {}
+        title_found = False
+        suppl_provisions: List[Dict[str, Any]] = []
+
+        for elem, parent in iterparse(self.source, _STREAM_TAGS):
+            tag = elem.tag
+            if tag == "law_title":
+                # 最初に現れたlaw_titleだけを法令名とする
+                if not title_found:
+                    title_found = True
+                    if elem.text:
+                        law_info["title"] = elem.text.strip()
+                release(elem, parent)
+                continue
+
+            if parent is None:
+                continue
+            if self._law_body is None:
+                if parent.tag != "LawBody":
+                    continue
+                self._law_body = parent
+            elif parent is not self._law_body:
+                continue
+
+            if tag == "LawNum":
+                if elem.text:
+                    law_info["law_num"] = elem.text.strip()
+            elif tag == "TOC":
+                self._extract_toc(elem)
+            elif tag == "MainProvision":
+                self._inspect_shape(elem)
+                self._extract_main_provisions(elem)
+            else:
+                self._inspect_shape(elem)
+                suppl_data = self._process_supplementary_provision(elem)
+                if suppl_data:
+                    suppl_provisions.append(suppl_data)
+            release(elem, parent)
+
+        self._set_law_info(law_info)
+        if suppl_provisions:
+            self._data["supplementary_provisions"] = suppl_provisions
+        data, self._data = self._data, {}
+        return data
+
     def to_yaml_string(self) -> str:
         """YAML文字列として出力
         self.yaml_dataをyaml.dumpでyaml形式に変換する
         Returns:
             YAML形式の文字列
         """
-        yaml_dict = self.convert()
-        return yaml.dump(
-            yaml_dict, allow_unicode=True, default_flow_style=False, sort_keys=False
+        buffer = io.StringIO()
+        self.dump_yaml(buffer)
+        return buffer.getvalue()
+
+    def dump_yaml(self, stream: IO[str]) -> None:
+        """YAMLをstreamに直接書き出す
+        巨大な法令でもYAML文字列全体をメモリ上に作らずにファイルへ保存できる．
+        Args:
+            stream: 書き込み先のテキストストリーム(open(..., "w")したファイルなど)
+        """
+        data = self._build()
+        yaml.dump(
+            data,
+            stream,
+            Dumper=_YamlDumper,
+            allow_unicode=True,
+            default_flow_style=False,
+            sort_keys=False,
         )
+        # convert()と同じく，変換結果を辞書とリストだけの形で残しておく
+        self.yaml_data = _to_plain(data)
 
-    def _extract_law_info(self) -> None:
-        """法令の基本情報を抽出
+    def _set_law_info(self, law_info: Dict[str, Any]) -> None:
+        """法令の基本情報をデータ構造の先頭に置く
         #TODO :: 再度全ての情報を過不足なく抽出できているか（スキップしているタグがないか）確認
         """
-        law_info = {}
-
-        # law_full_text/Law/LawBody/LawNum から法令番号を取得
-        law_full_text = self.root.find("law_full_text")
-        if law_full_text is not None:
-            law = law_full_text.find("Law")
-            if law is not None:
-                law_body = law.find("LawBody")
-                if law_body is not None:
-                    law_num = law_body.findtext("LawNum")
-                    if law_num:
-                        law_info["law_num"] = law_num.strip()
-
-        # その他の基本情報があれば追加
-        law_title_elem = self.root.find(".//law_title")
-        if law_title_elem is not None and law_title_elem.text:
-            law_info["title"] = law_title_elem.text.strip()
-
-        if law_info:
-            self.yaml_data["law_info"] = law_info
-
-    def _extract_toc(self) -> None:
-        """目次情報を抽出"""
-        law_full_text = self.root.find("law_full_text")
-        if law_full_text is None:
-            return
-
-        law = law_full_text.find("Law")
-        if law is None:
-            return
-
-        law_body = law.find("LawBody")
-        if law_body is None:
+        if not law_info:
             return
+        # 法令番号，法令名の順に並べる
+        ordered = {
+            key: law_info[key] for key in ("law_num", "title") if key in law_info
+        }
+        self._data = {"law_info": ordered, **self._data}
 
-        toc = law_body.find("TOC")
-        if toc is None:
-            return
+    def _inspect_shape(self, section) -> None:
+        """本則・附則に表(TableStruct)とサブ項目(Subitem1)があるかを調べておく
 
+        タグを絞ったiterはC側で走査するため，項・号ごとにfindするより安い．
+        """
+        self._has_tables = next(section.iter("TableStruct"), None) is not None
+        self._has_subitems = next(section.iter(_SUBITEM_TAGS[1]), None) is not None
+
+    @staticmethod
+    def _grab(elem, tag: str) -> Optional[str]:
+        """子要素tagのテキストを前後の空白を除いて返す(子要素がないかテキストが空ならNone)"""
+        child = elem.find(tag)
+        if child is None or not child.text:
+            return None
+        return child.text.strip()
+
+    def _extract_toc(self, toc) -> None:
+        """目次情報を抽出"""
         toc_data = []
 
         # TOCLabelを取得
-        toc_label = toc.findtext("TOCLabel")
-        if toc_label:
-            toc_data.append({"type": "label", "content": toc_label.strip()})
+        toc_label = self._grab(toc, "TOCLabel")
+        if toc_label is not None:
+            toc_data.append({"type": "label", "content": toc_label})
 
         # TOCChapterを処理
         for chapter in toc.findall("TOCChapter"):
-            chapter_title = chapter.findtext("ChapterTitle")
-            article_range = chapter.findtext("ArticleRange")
+            chapter_title = self._grab(chapter, "ChapterTitle")
+            article_range = self._grab(chapter, "ArticleRange")
 
-            if chapter_title and article_range:
+            if chapter_title is not None and article_range is not None:
                 toc_data.append(
                     {
                         "type": "chapter",
-                        "title": chapter_title.strip(),
-                        "article_range": article_range.strip(),
+                        "title": chapter_title,
+                        "article_range": article_range,
                     }
                 )
 
-        # TOCSupplProvisionを処理
-        toc_suppl = toc.find("TOCSupplProvision")
-        if toc_suppl is not None:
-            suppl_label = toc_suppl.findtext("SupplProvisionLabel")
-            if suppl_label:
-                toc_data.append(
-                    {"type": "supplementary", "content": suppl_label.strip()}
-                )
+        # TOCSupplProvisionを処理(パスを1回のfindでたどる)
+        suppl_label = self._grab(toc, "TOCSupplProvision/SupplProvisionLabel")
+        if suppl_label is not None:
+            toc_data.append({"type": "supplementary", "content": suppl_label})
 
         if toc_data:
-            self.yaml_data["table_of_contents"] = toc_data
+            self._data["table_of_contents"] = toc_data
 
-    def _extract_main_provisions(self) -> None:
+    def _extract_main_provisions(self, main_provision) -> None:
         """本則を抽出"""
-        law_full_text = self.root.find("law_full_text")
-        if law_full_text is None:
-            return
-
-        law = law_full_text.find("Law")
-        if law is None:
-            return
-
-        law_body = law.find("LawBody")
-        if law_body is None:
-            return
-
-        main_provision = law_body.find("MainProvision")
-        if main_provision is None:
-            return
-
         # Chapter構造かArticle構造かを判定
         if main_provision.find("Part") is not None:
             self._process_part_structure(main_provision)
@@ -160,7 +319,7 @@ class LawToYamlConverter:
                 parts.append(part_data)
 
         if parts:
-            self.yaml_data["parts"] = parts
+            self._data["parts"] = parts
 
     def _process_chapter_structure(self, main_provision) -> None:
         """Chapter構造の本則を処理"""
@@ -172,7 +331,7 @@ class LawToYamlConverter:
                 chapters.append(chapter_data)
 
         if chapters:
-            self.yaml_data["chapters"] = chapters
+            self._data["chapters"] = chapters
 
     def _process_article_structure(self, main_provision) -> None:
         """Article構造の本則を処理（施行規則等）"""
@@ -184,7 +343,7 @@ class LawToYamlConverter:
                 articles.append(article_data)
 
         if articles:
-            self.yaml_data["articles"] = articles
+            self._data["articles"] = articles
 
     def _process_part(self, chapter) -> Dict[str, Any]:
         """編(Part)を処理
@@ -194,11 +353,11 @@ class LawToYamlConverter:
         Part -> Article
         という構造もある．
         """
-        part_data = {}
+        part_data: Dict[str, Any] = {}
 
-        part_title = chapter.findtext("PartTitle")
-        if part_title:
-            part_data["title"] = part_title.strip()
+        part_title = self._grab(chapter, "PartTitle")
+        if part_title is not None:
+            part_data["title"] = part_title
             # 章番号を抽出（第X章の形式）
             part_num = self._extract_number_from_title(part_title)
             if part_num:
@@ -245,19 +404,21 @@ class LawToYamlConverter:
                     self._process_article(child)
 
         """
-        chapter_data = {}
+        chapter_data: Dict[str, Any] = {}
 
-        chapter_title = chapter.findtext("ChapterTitle")
-        if chapter_title:
-            chapter_data["title"] = chapter_title.strip()
+        chapter_title = self._grab(chapter, "ChapterTitle")
+        if chapter_title is not None:
+            chapter_data["title"] = chapter_title
             # 章番号を抽出（第X章の形式）
             chapter_num = self._extract_number_from_title(chapter_title)
             if chapter_num:
                 chapter_data["chapter_num"] = chapter_num
 
+        section_elems, article_elems = _split_children(chapter, "Section", "Article")
+
         # 章の下の節を処理
         sections = []
-        for section in chapter.findall("Section"):
+        for section in section_elems:
             section_data = self._process_section(section)
             if section_data:
                 sections.append(section_data)
@@ -267,7 +428,7 @@ class LawToYamlConverter:
 
         # 章の直下の条を処理（節がない場合）
         articles = []
-        for article in chapter.findall("Article"):
+        for article in article_elems:
             article_data = self._process_article(article)
             if article_data:
                 articles.append(article_data)
@@ -279,18 +440,22 @@ class LawToYamlConverter:
 
     def _process_section(self, section) -> Dict[str, Any]:
         """節を処理"""
-        section_data = {}
+        section_data: Dict[str, Any] = {}
 
-        section_title = section.findtext("SectionTitle")
-        if section_title:
-            section_data["title"] = section_title.strip()
+        section_title = self._grab(section, "SectionTitle")
+        if section_title is not None:
+            section_data["title"] = section_title
             section_num = self._extract_number_from_title(section_title)
             if section_num:
                 section_data["section_num"] = section_num
 
+        subsection_elems, article_elems = _split_children(
+            section, "Subsection", "Article"
+        )
+
         # 節の下のSubsectionを処理
         subsections = []
-        for subsection in section.findall("Subsection"):
+        for subsection in subsection_elems:
             subsection_data = self._process_subsection(subsection)
             if subsection_data:
                 subsections.append(subsection_data)
@@ -300,7 +465,7 @@ class LawToYamlConverter:
 
         # 節の下の条を処理（subsectionがない場合）
         articles = []
-        for article in section.findall("Article"):
+        for article in article_elems:
             article_data = self._process_article(article)
             if article_data:
                 articles.append(article_data)
@@ -312,19 +477,19 @@ class LawToYamlConverter:
 
     def _process_subsection(self, subsection) -> Dict[str, Any]:
         """subsectionを処理"""
-        subsection_data = {}
+        subsection_data: Dict[str, Any] = {}
 
         # subsectionのタイトル
-        subsection_title = subsection.findtext("SubsectionTitle")
-        if subsection_title:
-            subsection_data["title"] = subsection_title.strip()
+        subsection_title = self._grab(subsection, "SubsectionTitle")
+        if subsection_title is not None:
+            subsection_data["title"] = subsection_title
             subsection_num = self._extract_number_from_title(subsection_title)
             if subsection_num:
                 subsection_data["article_num"] = subsection_num
 
         # 節の下の条を処理（subsectionがない場合）
         articles = []
-        for article in subsection.findall("Article"):
+        for article in _child_elements(subsection, "Article"):
             article_data = self._process_article(article)
             if article_data:
                 articles.append(article_data)
@@ -334,45 +499,56 @@ class LawToYamlConverter:
 
         return subsection_data
 
-    def _process_article(self, article) -> Dict[str, Any]:
+    def _process_article(self, article) -> _ArticleData:
         """条を処理"""
-        article_data = {}
+        article_data = _ArticleData()
 
         # 条のキャプション
-        article_caption = article.findtext("ArticleCaption")
-        if article_caption:
-            article_data["caption"] = article_caption.strip()
+        article_data.caption = self._grab(article, "ArticleCaption")
 
         # 条のタイトル
-        article_title = article.findtext("ArticleTitle")
-        if article_title:
-            article_data["title"] = article_title.strip()
+        article_data.title = self._grab(article, "ArticleTitle")
 
         # 条のタグ(article_num)
         article_num = article.get("Num")
         if article_num:
-            article_data["article_num"] = article_num
+            article_data.article_num = article_num
 
         # 項を処理
         paragraphs = []
-        for paragraph in article.findall("Paragraph"):
+        for paragraph in _child_elements(article, "Paragraph"):
             paragraph_data = self._process_paragraph(paragraph)
             if paragraph_data:
                 paragraphs.append(paragraph_data)
 
         if paragraphs:
-            article_data["paragraphs"] = paragraphs
+            article_data.paragraphs = paragraphs
 
         return article_data
 
-    def _process_paragraph(self, paragraph) -> Dict[str, Any]:
-        """項を処理"""
-        paragraph_data = {}
+    def _process_paragraph(
+        self, paragraph, with_caption: bool = False
+    ) -> Dict[str, Any]:
+        """項を処理
+
+        Args:
+            paragraph: Paragraph要素
+            with_caption: ParagraphCaption(項の見出し)もcaptionとして出力するか．
+                附則の項で使う．このときは改正規定(AmendProvision)など，
+                号と表以外の子要素の文もcontentに含め，表は全てを出力する
+        """
+        paragraph_data: Dict[str, Any] = {}
+
+        # 項の見出し
+        if with_caption:
+            caption = self._grab(paragraph, "ParagraphCaption")
+            if caption is not None:
+                paragraph_data["caption"] = caption
 
         # 項番号
-        paragraph_num = paragraph.findtext("ParagraphNum")
-        if paragraph_num:
-            paragraph_data["paragraph_num"] = paragraph_num.strip()
+        paragraph_num = self._grab(paragraph, "ParagraphNum")
+        if paragraph_num is not None:
+            paragraph_data["paragraph_num"] = paragraph_num
             num = self._extract_number_from_text(paragraph_num)
             if num:
                 paragraph_data["num"] = num
@@ -384,9 +560,20 @@ class LawToYamlConverter:
             if sentences:
                 paragraph_data["content"] = sentences
 
+        # 附則の項では，号と表以外の子要素(改正規定，列記など)の文もcontentに加える
+        if with_caption:
+            extra = [
+                self._extract_sentences(child)
+                for child in paragraph
+                if child.tag not in _PARAGRAPH_HANDLED_TAGS
+            ]
+            sentences = " ".join(filter(None, [paragraph_data.get("content"), *extra]))
+            if sentences:
+                paragraph_data["content"] = sentences
+
         # 号を処理
         items = []
-        for item in paragraph.findall("Item"):
+        for item in _child_elements(paragraph, "Item"):
             item_data = self._process_item(item)
             if item_data:
                 items.append(item_data)
@@ -395,22 +582,37 @@ class LawToYamlConverter:
             paragraph_data["items"] = items
 
         # 表を処理
-        table_struct = paragraph.find("TableStruct")
-        if table_struct is not None:
-            table_data = self._process_table(table_struct)
-            if table_data:
-                paragraph_data["table"] = table_data
+        if self._has_tables:
+            if with_caption:
+                # 附則の項では全ての表を出力する(2つ以上ならtablesにまとめる)
+                tables = [
+                    table_data
+                    for table_data in map(
+                        self._process_table, _child_elements(paragraph, "TableStruct")
+                    )
+                    if table_data
+                ]
+                if len(tables) == 1:
+                    paragraph_data["table"] = tables[0]
+                elif tables:
+                    paragraph_data["tables"] = tables
+            else:
+                table_struct = paragraph.find("TableStruct")
+                if table_struct is not None:
+                    table_data = self._process_table(table_struct)
+                    if table_data:
+                        paragraph_data["table"] = table_data
 
         return paragraph_data
 
     def _process_item(self, item) -> Dict[str, Any]:
         """号を処理"""
-        item_data = {}
+        item_data: Dict[str, Any] = {}
 
         # 号のタイトル
-        item_title = item.findtext("ItemTitle")
-        if item_title:
-            item_data["title"] = item_title.strip()
+        item_title = self._grab(item, "ItemTitle")
+        if item_title is not None:
+            item_data["title"] = item_title
             item_num = self._extract_number_from_text(item_title)
             if item_num:
                 item_data["item_num"] = item_num
@@ -423,64 +625,63 @@ class LawToYamlConverter:
                 item_data["content"] = sentences
 
         # サブ項目を処理
-        subitems = []
-        for subitem in item.findall("Subitem1"):
-            subitem_data = self._process_subitem(subitem, 1)
-            if subitem_data:
-                subitems.append(subitem_data)
-
-        if subitems:
-            item_data["subitems"] = subitems
+        if self._has_subitems:
+            subitems = self._process_subitems(_child_elements(item, _SUBITEM_TAGS[1]))
+            if subitems:
+                item_data["subitems"] = subitems
 
         # 表を処理
-        table_struct = item.find("TableStruct")
-        if table_struct is not None:
-            table_data = self._process_table(table_struct)
-            if table_data:
-                item_data["table"] = table_data
+        if self._has_tables:
+            table_struct = item.find("TableStruct")
+            if table_struct is not None:
+                table_data = self._process_table(table_struct)
+                if table_data:
+                    item_data["table"] = table_data
 
         return item_data
 
-    def _process_subitem(self, subitem, level: int) -> Dict[str, Any]:
-        """サブ項目を再帰的に処理"""
-        subitem_data: Dict[str, Any] = {}
-        subitem_data["level"] = level
-
-        # サブ項目のタイトル
-        title_tag = f"Subitem{level}Title"
-        title = subitem.findtext(title_tag)
-        if title:
-            subitem_data["title"] = title.strip()
-
-        # サブ項目の文章
-        sentence_tag = f"Subitem{level}Sentence"
-        sentence = subitem.find(sentence_tag)
-        if sentence is not None:
-            sentences = self._extract_sentences(sentence)
-            if sentences:
-                subitem_data["content"] = sentences
-
-        # 次のレベルのサブ項目を処理
-        next_level = level + 1
-        next_subitem_tag = f"Subitem{next_level}"
-        next_subitems = []
-
-        for next_subitem in subitem.findall(next_subitem_tag):
-            next_subitem_data = self._process_subitem(next_subitem, next_level)
-            if next_subitem_data:
-                next_subitems.append(next_subitem_data)
+    def _process_subitems(self, subitems) -> List[Dict[str, Any]]:
+        """Subitem1の要素列から，入れ子のサブ項目を含めて処理する
 
-        if next_subitems:
-            subitem_data["subitems"] = next_subitems
-
-        # 表を処理
-        table_struct = subitem.find("TableStruct")
-        if table_struct is not None:
-            table_data = self._process_table(table_struct)
-            if table_data:
-                subitem_data["table"] = table_data
-
-        return subitem_data
+        再帰の代わりに(要素, 追加先のリスト, 階層)の作業リストで木をたどる．
+        """
+        result: List[Dict[str, Any]] = []
+        queue = deque((subitem, result, 1) for subitem in subitems)
+        while queue:
+            subitem, siblings, level = queue.popleft()
+            subitem_data: Dict[str, Any] = {"level": level}
+            siblings.append(subitem_data)
+
+            # サブ項目のタイトル
+            title = self._grab(subitem, _SUBITEM_TITLE_TAGS[level])
+            if title is not None:
+                subitem_data["title"] = title
+
+            # サブ項目の文章
+            sentence = subitem.find(_SUBITEM_SENTENCE_TAGS[level])
+            if sentence is not None:
+                sentences = self._extract_sentences(sentence)
+                if sentences:
+                    subitem_data["content"] = sentences
+
+            # 次のレベルのサブ項目は，このサブ項目のリストに追加されるよう積んでおく
+            if level < _SUBITEM_MAX_LEVEL:
+                children = _child_elements(subitem, _SUBITEM_TAGS[level + 1])
+                if children:
+                    next_subitems: List[Dict[str, Any]] = []
+                    subitem_data["subitems"] = next_subitems
+                    queue.extend(
+                        (child, next_subitems, level + 1) for child in children
+                    )
+
+            # 表を処理
+            table_struct = subitem.find("TableStruct")
+            if table_struct is not None:
+                table_data = self._process_table(table_struct)
+                if table_data:
+                    subitem_data["table"] = table_data
+
+        return result
 
     def _process_table(self, table_struct) -> Dict[str, Any]:
         """表を処理
@@ -492,121 +693,36 @@ class LawToYamlConverter:
             return {}
 
         rows = []
-        for row in table.findall(".//TableRow"):
-            cols = []
-            for col in row.findall("TableColumn"):
-                sentences = self._extract_sentences(col)
-                cols.append(sentences if sentences else "")
+        extract_sentences = self._extract_sentences
+        for row in table.iter("TableRow"):
+            # 列は行の直下だけを見る(入れ子の表の列は含めない)
+            cols = [
+                extract_sentences(col) or "" for col in row if col.tag == "TableColumn"
+            ]
             if cols:
                 rows.append(cols)
 
         return {"rows": rows} if rows else {}
 
     def _extract_sentences(self, container) -> str:
-        """文章コンテナから文章を抽出"""
-        sentences = []
-        for sentence in container.findall(".//Sentence"):
-            sentence_text = self._extract_sentence_text(sentence)
-            if sentence_text:
-                sentences.append(sentence_text)
-        return " ".join(sentences) if sentences else ""
-
-    def _extract_sentence_text(self, sentence) -> str:
-        """文要素からテキストを抽出（ルビ対応）
-        TODO:: text extractorと全く同じ実装なので被りを解除したい．
-        """
-
-        def process_element(elem):
-            """要素を再帰的に処理してテキストを抽出"""
-            text_parts = []
-
-            # 要素のテキスト（開始タグ直後のテキスト）
-            if elem.text:
-                text_parts.append(elem.text)
-
-            # 子要素を処理
-            for child in elem:
-                if child.tag == "Ruby":
-                    # Ruby要素の場合は特別処理
-                    text_parts.append(self._get_ruby_text(child))
-                else:
-                    # その他の子要素は再帰処理
-                    text_parts.append(process_element(child))
-
-                # 子要素の後のテキスト（tail）
-                if child.tail:
-                    text_parts.append(child.tail)
-
-            return "".join(text_parts)
-
-        return process_element(sentence).strip()
-
-    def _get_ruby_text(self, element) -> str:
-        """ルビ要素を処理: <Ruby>漢字<Rt>読み</Rt></Ruby> → 漢字（読み）"""
-        rt_element = element.find("Rt")
-        if rt_element is not None and element.text:
-            return f"{element.text}（{rt_element.text}）"
-
-        # フォールバック: 全てのテキストを結合
-        return "".join(element.itertext())
-
-    def _extract_supplementary_provisions(self) -> None:
-        """附則を抽出"""
-        law_full_text = self.root.find("law_full_text")
-        if law_full_text is None:
-            return
-
-        law = law_full_text.find("Law")
-        if law is None:
-            return
-
-        law_body = law.find("LawBody")
-        if law_body is None:
-            return
-
-        suppl_provisions = []
-        for suppl in law_body.findall("SupplProvision"):
-            suppl_data = self._process_supplementary_provision(suppl)
-            if suppl_data:
-                suppl_provisions.append(suppl_data)
-
-        if suppl_provisions:
-            self.yaml_data["supplementary_provisions"] = suppl_provisions
+        """文章コンテナから文章を抽出(空の文は除いて半角スペースで連結する)"""
+        return " ".join(
+            filter(None, map(extract_sentence_text, container.iter("Sentence")))
+        )
 
     def _process_supplementary_provision(self, suppl) -> Dict[str, Any]:
         """附則を処理"""
-        suppl_data = {}
+        suppl_data: Dict[str, Any] = {}
 
         # 附則のラベル
-        suppl_label = suppl.findtext("SupplProvisionLabel")
-        if suppl_label:
-            suppl_data["label"] = suppl_label.strip()
+        suppl_label = self._grab(suppl, "SupplProvisionLabel")
+        if suppl_label is not None:
+            suppl_data["label"] = suppl_label
 
         # 附則の段落を処理
         paragraphs = []
-        for paragraph in suppl.findall("Paragraph"):
-            para_data = {}
-
-            # 段落キャプション
-            caption = paragraph.findtext("ParagraphCaption")
-            if caption:
-                para_data["caption"] = caption.strip()
-
-            # 段落番号
-            para_num = paragraph.findtext("ParagraphNum")
-            if para_num:
-                para_data["paragraph_num"] = para_num.strip()
-
-            # 段落の文章
-            sentences = []
-            for sentence in paragraph.findall(".//Sentence"):
-                sentence_text = self._extract_sentence_text(sentence)
-                if sentence_text:
-                    sentences.append(sentence_text)
-
-            if sentences:
-                para_data["content"] = " ".join(sentences)
-
+        for paragraph in _child_elements(suppl, "Paragraph"):
+            para_data = self._process_paragraph(paragraph, with_caption=True)
             if para_data:
                 paragraphs.append(para_data)
 
@@ -617,7 +733,7 @@ class LawToYamlConverter:
 
     def _extract_number_from_title(self, title: str) -> Optional[int]:
         """タイトルから番号を抽出（第X章、第X節など）"""
-        match = re.search(r"第([一二三四五六七八九十百千万壱弐参拾]+|[0-9]+)", title)
+        match = _TITLE_NUM_RE.search(title)
         if match:
             num_str = match.group(1)
             if num_str.isdigit():
@@ -629,85 +745,77 @@ class LawToYamlConverter:
 
     def _extract_number_from_text(self, text: str) -> Optional[int]:
         """テキストから数字を抽出"""
-        match = re.search(r"([0-9]+)", text)
+        match = _DIGIT_RE.search(text)
         if match:
             return int(match.group(1))
         return None
 
     def _convert_kanji_to_number(self, kanji: str) -> Optional[int]:
-        """漢数字を数字に変換
-        # TODO :: これで足りてるか？
-        """
-        kanji_map = {
-            "一": 1,
-            "二": 2,
-            "三": 3,
-            "四": 4,
-            "五": 5,
-            "六": 6,
-            "七": 7,
-            "八": 8,
-            "九": 9,
-            "十": 10,
-            "壱": 1,
-            "弐": 2,
-            "参": 3,
-        }
+        """漢数字を数字に変換(漢数字以外の文字を含む場合はNone)"""
+        return kanji_to_int(kanji)
 
-        if kanji in kanji_map:
-            return kanji_map[kanji]
-
-        # 百の位の処理
-        if "百" in kanji:
-            if kanji == "百":
-                return 100
-            elif kanji.startswith("百"):
-                # 百〇〇の形
-                remaining = kanji[1:]
-                remaining_value = self._convert_kanji_to_number(remaining) or 0
-                return 100 + remaining_value
-            elif kanji.endswith("百"):
-                # 〇百の形
-                left_part = kanji[:-1]
-                left_value = kanji_map.get(left_part, 1) if left_part else 1
-                return left_value * 100
-            else:
-                # 〇百〇〇の形
-                parts = kanji.split("百")
-                if len(parts) == 2:
-                    left_value = kanji_map.get(parts[0], 1) if parts[0] else 1
-                    right_value = self._convert_kanji_to_number(parts[1]) or 0
-                    return left_value * 100 + right_value
-
-        # 十の位の処理（簡易版）
-        if "十" in kanji:
-            if kanji == "十":
-                return 10
-            elif kanji.startswith("十"):
-                return 10 + kanji_map.get(kanji[1], 0)
-            elif kanji.endswith("十"):
-                return kanji_map.get(kanji[0], 0) * 10
-            else:
-                parts = kanji.split("十")
-                if len(parts) == 2:
-                    left = kanji_map.get(parts[0], 0) if parts[0] else 1
-                    right = kanji_map.get(parts[1], 0)
-                    return left * 10 + right
 
-        return None
+# convert_xml_to_yaml()の結果のキャッシュ(入力XMLのSHA-1 → YAML文字列)．
+# 入力そのものをキーにすると巨大なXMLを保持し続けるため，ダイジェストだけを持つ
+_YAML_CACHE_SIZE = 128
+_yaml_cache: OrderedDict[str, str] = OrderedDict()
+_yaml_cache_lock = threading.Lock()
 
 
-def convert_xml_to_yaml(xml_string: str) -> str:
+def convert_xml_to_yaml(xml_string: str | bytes) -> str:
     """XMLを構造化YAMLに変換する便利関数
 
+    同じXMLを繰り返し変換するバッチ処理向けに，直近128件の結果をキャッシュする．
+
     Args:
         xml_string: 法令のXML文字列
 
     Returns:
         YAML形式の文字列
     """
+    # strをエンコードした一時的なbytesは，ダイジェストを取ったらすぐ手放す
+    key = hashlib.sha1(
+        xml_string.encode("utf-8") if isinstance(xml_string, str) else xml_string
+    ).hexdigest()
+
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached is not None:
+            _yaml_cache.move_to_end(key)
+            return cached
+
     converter = LawToYamlConverter(xml_string)
-    return converter.to_yaml_string()
+    result = converter.to_yaml_string()
+
+    with _yaml_cache_lock:
+        _yaml_cache[key] = result
+        if len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    return result
+
+
+def clear_yaml_cache() -> None:
+    """convert_xml_to_yaml()のキャッシュを空にする"""
+    with _yaml_cache_lock:
+        _yaml_cache.clear()
+
+
+def convert_laws_to_yaml(
+    xml_strings: Iterable[str | bytes], workers: Optional[int] = None
+) -> List[str]:
+    """複数の法令XMLをプロセスプールで並列にYAMLへ変換する
+
+    章単位で分けると部分木の直列化と結果の受け渡しが変換そのものより重くなるため，
+    法令単位でプロセスに割り振る．
+
+    Args:
+        xml_strings: 法令のXML文字列
+        workers: ワーカープロセス数（Noneの場合はCPU数）
+
+    Returns:
+        YAML形式の文字列（xml_stringsと同じ順番）
+    """
+    return _map_in_process_pool(convert_xml_to_yaml, xml_strings, workers)
 
 
 # 使用例
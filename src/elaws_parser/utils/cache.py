@@ -0,0 +1,137 @@
+"""
+APIの取得結果をディスクに保存するTTL付きキャッシュ
+既定では無効で，環境変数ELAWS_PARSER_CACHE_DIRを設定するか，
+configure_disk_cache()でディレクトリを指定すると有効になる．
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+CACHE_DIR_ENV = "ELAWS_PARSER_CACHE_DIR"
+DEFAULT_TTL = 7 * 24 * 60 * 60  # 1週間
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class DiskCache:
+    """キーごとに1ファイルで値(bytes)を保存するTTL付きキャッシュ"""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            directory: キャッシュファイルを置くディレクトリ
+            ttl: 有効期限(秒)
+            max_entries: 保持する最大件数．超えたら古いものから1割を削除する
+        """
+        self.directory = Path(directory).expanduser()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.cache"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """キーに対応する値を返す．存在しないか期限切れならNone"""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink()
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        """値を保存する(書き込み途中のファイルを読まないよう，一時ファイル経由で置き換える)"""
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(value)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def clear(self) -> None:
+        """全てのキャッシュを削除する"""
+        for path in self.directory.glob("*.cache"):
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """件数が上限を超えたら，古いものから(少なくとも)1割を削除する"""
+        entries = list(self.directory.glob("*.cache"))
+        if len(entries) <= self.max_entries:
+            return
+        # 他のスレッド・プロセスが同時に削除したファイルは飛ばす
+        dated = []
+        for path in entries:
+            try:
+                dated.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        n_remove = max(len(dated) - self.max_entries, len(dated) // 10)
+        dated.sort(key=lambda entry: entry[0])
+        for _, path in dated[:n_remove]:
+            path.unlink(missing_ok=True)
+
+
+_disk_cache: Optional[DiskCache] = (
+    DiskCache(os.environ[CACHE_DIR_ENV]) if os.environ.get(CACHE_DIR_ENV) else None
+)
+
+
+def configure_disk_cache(
+    directory: str | Path | None,
+    *,
+    ttl: float = DEFAULT_TTL,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> Optional[DiskCache]:
+    """ディスクキャッシュの保存先を設定する(Noneを渡すと無効化)"""
+    global _disk_cache
+    _disk_cache = (
+        DiskCache(directory, ttl=ttl, max_entries=max_entries)
+        if directory is not None
+        else None
+    )
+    return _disk_cache
+
+
+def disk_cached(func: F) -> F:
+    """戻り値(JSONで表せるもの)をディスクキャッシュに保存するデコレーター
+
+    キャッシュが無効のとき，または戻り値がNoneのときはそのまま関数の結果を返す．
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _disk_cache
+        if cache is None:
+            return func(*args, **kwargs)
+
+        key = json.dumps(
+            [func.__module__, func.__qualname__, args, sorted(kwargs.items())],
+            ensure_ascii=False,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        result = func(*args, **kwargs)
+        if result is not None:
+            cache.set(key, json.dumps(result, ensure_ascii=False).encode("utf-8"))
+        return result
+
+    return wrapper  # type: ignore[return-value]
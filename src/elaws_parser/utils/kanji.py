@@ -0,0 +1,55 @@
+"""
+漢数字(第X章などの見出しに現れるもの)を整数に変換するユーティリティ
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional
+
+# 漢数字の数字と位取りの文字
+_KANJI_DIGIT = {
+    "一": 1,
+    "二": 2,
+    "三": 3,
+    "四": 4,
+    "五": 5,
+    "六": 6,
+    "七": 7,
+    "八": 8,
+    "九": 9,
+    "壱": 1,
+    "弐": 2,
+    "参": 3,
+}
+_KANJI_UNIT = {"十": 10, "拾": 10, "百": 100, "千": 1000}
+_KANJI_MAN = "万"
+
+
+@lru_cache(maxsize=4096)
+def kanji_to_int(kanji: str) -> Optional[int]:
+    """漢数字を整数に変換する
+
+    左から1回だけ走査し，十・百・千の前の数字(省略時は1)を掛けて足し込む．
+    万はそれまでの4桁分をまとめて1万倍する．
+    漢数字以外の文字を含む場合はNoneを返す．
+    見出しの番号は法令間でも同じものが繰り返し現れるため，結果をキャッシュする．
+    """
+    total = 0  # 万の位より上
+    section = 0  # 千の位以下
+    current = 0  # 位取りの前の数字
+    for char in kanji:
+        digit = _KANJI_DIGIT.get(char)
+        if digit is not None:
+            current = digit
+            continue
+        unit = _KANJI_UNIT.get(char)
+        if unit is not None:
+            section += (current or 1) * unit
+        elif char == _KANJI_MAN:
+            total += ((section + current) or 1) * 10000
+            section = 0
+        else:
+            return None
+        current = 0
+    return total + section + current
@@ -0,0 +1,29 @@
+"""
+複数の法令をプロセスプールで並列に処理するユーティリティ
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# 1回のプロセス間通信でワーカーに渡す法令の数
+_CHUNKSIZE = 4
+
+
+def _map_in_process_pool(
+    func: Callable[[_T], _R], xmls: Iterable[_T], workers: Optional[int] = None
+) -> List[_R]:
+    """xmlsの各要素にfuncをプロセスプールで適用し，結果を入力と同じ順番で返す
+
+    Args:
+        func: 各法令に適用する関数(ワーカーに渡すためモジュールレベルの関数であること)
+        xmls: 法令のXML文字列
+        workers: ワーカープロセス数（Noneの場合はCPU数）
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # chunksizeでまとめて渡し，プロセス間通信の回数を減らす
+        return list(executor.map(func, xmls, chunksize=_CHUNKSIZE))
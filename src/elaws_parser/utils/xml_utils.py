@@ -0,0 +1,157 @@
+"""
+XMLパーサーのバックエンドを切り替えるユーティリティ
+lxmlがインストールされていればlxml.etree(libxml2)を利用し，
+なければ標準ライブラリのxml.etree.ElementTreeにフォールバックする．
+"""
+
+from __future__ import annotations
+
+import io
+from typing import IO, Any, Iterator, List, Optional, Tuple
+
+try:
+    from lxml import etree as ElementTree
+
+    HAS_LXML = True
+except ImportError:  # pragma: no cover
+    from xml.etree import ElementTree  # type: ignore[no-redef]
+
+    HAS_LXML = False
+
+# lxmlと標準ライブラリで要素の型が異なるため，型注釈上はAnyとして扱う
+Element = Any
+
+# lxmlのXMLSyntaxErrorはParseErrorのサブクラスなので，どちらのバックエンドでもこれで捕捉できる
+ParseError = ElementTree.ParseError
+
+
+def fromstring(xml: str | bytes) -> Any:
+    """XML文字列をパースしてルート要素を返す
+
+    lxmlはエンコーディング宣言付きのstrを受け付けないため，strはUTF-8のbytesにしてから渡す．
+    標準ライブラリのパーサーと同じ木になるように，コメントと処理命令は取り除く．
+    lxmlでは巨大な法令(数十MB)でも上限に掛からないようhuge_treeを有効にし，
+    法令XMLでは使わないID属性の索引作成(collect_ids)は省く．
+    """
+    if isinstance(xml, str):
+        xml = xml.encode("utf-8")
+    if HAS_LXML:
+        # パーサーはスレッド間で共有できないため，呼び出しごとに生成する
+        parser = ElementTree.XMLParser(
+            remove_comments=True, remove_pis=True, huge_tree=True, collect_ids=False
+        )
+        return ElementTree.fromstring(xml, parser=parser)
+    return ElementTree.fromstring(xml)
+
+
+def as_element(xml: str | bytes | Element) -> Element:
+    """XML文字列ならパースし，パース済みの要素ならそのまま返す"""
+    if isinstance(xml, (str, bytes)):
+        return fromstring(xml)
+    return xml
+
+
+def iterparse(
+    source: str | bytes | IO[bytes], tags: Tuple[str, ...]
+) -> Iterator[Tuple[Element, Optional[Element]]]:
+    """XMLを逐次パースし，tagsの要素が閉じるたびに(要素, 親要素)を返す
+
+    木全体を作らずに済むよう，処理し終えた要素はrelease()で木から外すこと．
+    lxmlではタグの絞り込みと親の参照をC側に任せる．標準ライブラリのiterparseは
+    どちらもできないため，開始イベントで祖先を積んでPython側で絞り込む．
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    if HAS_LXML:
+        for _, elem in ElementTree.iterparse(
+            source,
+            events=("end",),
+            tag=tags,
+            remove_comments=True,
+            remove_pis=True,
+            huge_tree=True,
+            collect_ids=False,
+        ):
+            yield elem, elem.getparent()
+        return
+
+    wanted = frozenset(tags)
+    ancestors: list = []
+    for event, elem in ElementTree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            ancestors.append(elem)
+            continue
+        ancestors.pop()
+        if elem.tag in wanted:
+            yield elem, ancestors[-1] if ancestors else None
+
+
+def release(elem: Element, parent: Optional[Element]) -> None:
+    """処理済みの要素を空にし，その要素と前の兄弟要素を親から外す"""
+    elem.clear()
+    if parent is None:
+        return
+    while len(parent) and parent[0] is not elem:
+        del parent[0]
+    if len(parent):
+        del parent[0]
+
+
+def extract_sentence_text(sentence: Element) -> str:
+    """法令XMLの文要素(Sentenceなど)のテキストを前後の空白を除いて返す
+
+    Ruby要素は「漢字（読み）」の形にする．text_converterとyaml_converterで共通に使う．
+    """
+    # 大半の文は子要素を持たないので，textをそのまま返す
+    if len(sentence) == 0:
+        text = sentence.text
+        return text.strip() if text else ""
+
+    # Rubyを含まない文はitertextで一括して連結する
+    if sentence.find(".//Ruby") is None:
+        return "".join(sentence.itertext()).strip()
+
+    # Rubyを含む文は明示的なスタックで走査し，Ruby要素だけ特別処理する
+    text_parts: List[str] = []
+    append = text_parts.append
+    if sentence.text:
+        append(sentence.text)
+
+    # (子要素のイテレータ, 子要素を処理し終えた後に追加するtail)のスタック
+    stack = [(iter(sentence), None)]
+    while stack:
+        children, tail = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if tail:
+                append(tail)
+            continue
+
+        if child.tag == "Ruby":
+            append(ruby_text(child))
+            if child.tail:
+                append(child.tail)
+        else:
+            if child.text:
+                append(child.text)
+            stack.append((iter(child), child.tail))
+
+    return "".join(text_parts).strip()
+
+
+def ruby_text(element: Element) -> str:
+    """ルビ要素を処理する: <Ruby>漢字<Rt>読み</Rt></Ruby> → 漢字（読み）"""
+    base = element.text
+    if base:
+        rt_element = element.find("Rt")
+        if rt_element is not None:
+            # 読みが空の場合は「（None）」とせず，親字だけを返す
+            reading = rt_element.text
+            return f"{base}（{reading}）" if reading else base
+
+    # フォールバック: 全てのテキストを結合
+    return "".join(element.itertext())
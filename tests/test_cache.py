@@ -0,0 +1,82 @@
+import os
+import time
+
+from elaws_parser.utils import cache as cache_module
+from elaws_parser.utils.cache import DiskCache, configure_disk_cache, disk_cached
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = DiskCache(tmp_path)
+    assert cache.get("key") is None
+
+    cache.set("key", "値".encode("utf-8"))
+    assert cache.get("key") == "値".encode("utf-8")
+
+
+def test_disk_cache_expires(tmp_path):
+    cache = DiskCache(tmp_path, ttl=60)
+    cache.set("key", b"value")
+
+    # 更新時刻を有効期限より前にずらす
+    path = cache._path("key")
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    assert cache.get("key") is None
+    assert not path.exists()
+
+
+def test_disk_cache_evicts_oldest(tmp_path):
+    cache = DiskCache(tmp_path, max_entries=3)
+    for i in range(3):
+        cache.set(f"key{i}", b"value")
+        old = time.time() - 100 + i
+        os.utime(cache._path(f"key{i}"), (old, old))
+
+    cache.set("key3", b"value")
+
+    assert cache.get("key0") is None
+    assert [cache.get(f"key{i}") for i in range(1, 4)] == [b"value"] * 3
+
+
+def test_disk_cache_evict_skips_vanished_files(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path, max_entries=1)
+    cache.set("a", b"1")
+    old = time.time() - 100
+    os.utime(cache._path("a"), (old, old))
+
+    # 別のスレッドが一覧取得後に削除したファイルを模擬する
+    vanished = tmp_path / "vanished.cache"
+    original_glob = type(tmp_path).glob
+
+    def glob_with_vanished(self, pattern):
+        return [*original_glob(self, pattern), vanished]
+
+    monkeypatch.setattr(type(tmp_path), "glob", glob_with_vanished)
+
+    cache.set("b", b"2")
+    assert cache.get("a") is None
+    assert cache.get("b") == b"2"
+
+
+def test_disk_cached_decorator(tmp_path):
+    calls = []
+
+    @disk_cached
+    def fetch(law_id, output_type="xml"):
+        calls.append(law_id)
+        return [law_id, output_type]
+
+    previous = cache_module._disk_cache
+    try:
+        configure_disk_cache(tmp_path)
+        assert fetch("123", output_type="list") == ["123", "list"]
+        assert fetch("123", output_type="list") == ["123", "list"]
+        assert calls == ["123"]
+
+        # 無効化すると毎回関数が呼ばれる
+        configure_disk_cache(None)
+        fetch("123", output_type="list")
+        assert calls == ["123", "123"]
+    finally:
+        cache_module._disk_cache = previous
@@ -1,12 +1,16 @@
 from unittest.mock import Mock, patch
 import pytest
+import requests
 from elaws_parser.api.hourei_apiv2 import (
+    extract_section_elements,
     extract_sections_from_xml,
+    get_lawdata_batch,
     get_lawdata_from_law_id,
     get_lawdata_from_lawname,
     get_lawid_from_lawtitle,
     save_xml_string_to_file,
 )
+from elaws_parser.utils.cache import configure_disk_cache
 
 
 def test_get_lawid_from_lawtitle_exact_match():
@@ -27,8 +31,9 @@ def test_get_lawid_from_lawtitle_exact_match():
     </response>
     """
 
-    with patch("requests.get") as mock_get:
+    with patch("elaws_parser.api.hourei_apiv2._SESSION.get") as mock_get:
         mock_response = Mock()
+        mock_response.status_code = 200
         mock_response.content = mock_xml.encode("utf-8")
         mock_get.return_value = mock_response
 
@@ -39,6 +44,7 @@ def test_get_lawid_from_lawtitle_exact_match():
         mock_get.assert_called_once_with(
             "https://laws.e-gov.go.jp/api/2/laws",
             params={"response_format": "xml", "law_title": "環境基本法"},
+            timeout=30,
         )
 
 
@@ -59,8 +65,9 @@ def test_get_lawid_from_lawtitle_all_matches():
     </response>
     """
 
-    with patch("requests.get") as mock_get:
+    with patch("elaws_parser.api.hourei_apiv2._SESSION.get") as mock_get:
         mock_response = Mock()
+        mock_response.status_code = 200
         mock_response.content = mock_xml.encode("utf-8")
         mock_get.return_value = mock_response
 
@@ -71,10 +78,43 @@ def test_get_lawid_from_lawtitle_all_matches():
         assert result == {"環境基本法": "12345"}
 
 
+@pytest.mark.parametrize(
+    "status_code, content, error",
+    [
+        (500, b"<response/>", requests.HTTPError),
+        (200, b"<response><count>0</count></response>", ValueError),
+    ],
+)
+def test_get_lawid_from_lawtitle_error_is_not_cached(
+    tmp_path, status_code, content, error
+):
+    configure_disk_cache(tmp_path)
+    try:
+        with patch("elaws_parser.api.hourei_apiv2._SESSION.get") as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = status_code
+            mock_response.content = content
+            if status_code != 200:
+                mock_response.raise_for_status.side_effect = requests.HTTPError(
+                    str(status_code)
+                )
+            mock_get.return_value = mock_response
+
+            for _ in range(2):
+                with pytest.raises(error):
+                    get_lawid_from_lawtitle(f"エラー法{status_code}", if_exact=False)
+
+        # 失敗はメモリ(lru_cache)にもディスクにもキャッシュされず，毎回再取得される
+        assert mock_get.call_count == 2
+        assert list(tmp_path.glob("*.cache")) == []
+    finally:
+        configure_disk_cache(None)
+
+
 def test_get_lawdata_from_law_id_xml():
     mock_xml_content = "<LawData><LawNum>123</LawNum></LawData>"
 
-    with patch("requests.get") as mock_get:
+    with patch("elaws_parser.api.hourei_apiv2._SESSION.get") as mock_get:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = mock_xml_content.encode("utf-8")
@@ -89,7 +129,7 @@ def test_get_lawdata_from_law_id_list():
         "<LawData><LawNum>123</LawNum><LawTitle>環境基本法</LawTitle></LawData>"
     )
 
-    with patch("requests.get") as mock_get:
+    with patch("elaws_parser.api.hourei_apiv2._SESSION.get") as mock_get:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = mock_xml_content.encode("utf-8")
@@ -99,8 +139,24 @@ def test_get_lawdata_from_law_id_list():
         assert result == ["123", "環境基本法"]
 
 
+def test_get_lawdata_from_law_id_list_document_order():
+    mock_xml_content = (
+        "<LawData>前<Sentence>本文<Ruby>漢字<Rt>かんじ</Rt></Ruby>後</Sentence>"
+        "<LawNum> </LawNum><LawTitle>題名</LawTitle></LawData>"
+    )
+
+    with patch("elaws_parser.api.hourei_apiv2._SESSION.get") as mock_get:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = mock_xml_content.encode("utf-8")
+        mock_get.return_value = mock_response
+
+        result = get_lawdata_from_law_id("12345", "list")
+        assert result == ["前", "本文", "漢字", "かんじ", "題名"]
+
+
 def test_get_lawdata_from_law_id_failure():
-    with patch("requests.get") as mock_get:
+    with patch("elaws_parser.api.hourei_apiv2._SESSION.get") as mock_get:
         mock_response = Mock()
         mock_response.status_code = 404
         mock_get.return_value = mock_response
@@ -110,7 +166,7 @@ def test_get_lawdata_from_law_id_failure():
 
 
 def test_get_lawdata_from_law_id_invalid_type():
-    with patch("requests.get") as mock_get:
+    with patch("elaws_parser.api.hourei_apiv2._SESSION.get") as mock_get:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = b"<dummy/>"
@@ -120,6 +176,20 @@ def test_get_lawdata_from_law_id_invalid_type():
             get_lawdata_from_law_id("12345", "invalid_type")  # type: ignore
 
 
+def test_get_lawdata_batch_keeps_order():
+    def fake_get(url, params, timeout):
+        law_id = url.rsplit("/", 1)[-1]
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = f"<LawData>{law_id}</LawData>".encode("utf-8")
+        return mock_response
+
+    with patch("elaws_parser.api.hourei_apiv2._SESSION.get", side_effect=fake_get):
+        result = get_lawdata_batch(["1", "2", "3"], "list", max_workers=2)
+
+    assert result == [["1"], ["2"], ["3"]]
+
+
 def test_get_lawdata_from_lawname():
     with patch(
         "elaws_parser.api.hourei_apiv2.get_lawid_from_lawtitle"
@@ -177,6 +247,28 @@ def test_extract_sections_from_xml_success():
     assert "<Paragraph>附則2</Paragraph>" in result["SupplProvision"][1]
 
 
+def test_extract_section_elements_returns_elements():
+    xml_data = """<?xml version="1.0" encoding="UTF-8"?>
+    <LawData>
+        <law_full_text>
+            <Law>
+                <LawBody>
+                    <MainProvision><Paragraph>本文</Paragraph></MainProvision>
+                    <SupplProvision><Paragraph>附則</Paragraph></SupplProvision>
+                </LawBody>
+            </Law>
+        </law_full_text>
+    </LawData>
+    """
+
+    result = extract_section_elements(xml_data)
+
+    assert result["TOC"] is None
+    assert result["MainProvision"].tag == "MainProvision"
+    assert result["MainProvision"].findtext("Paragraph") == "本文"
+    assert [s.findtext("Paragraph") for s in result["SupplProvision"]] == ["附則"]
+
+
 def test_extract_sections_from_xml_missing_elements():
     invalid_xml = "<invalid></invalid>"
     with pytest.raises(ValueError, match="law_full_textタグが見つかりません"):
@@ -1,9 +1,22 @@
 import glob
+import hashlib
+import io
 import os
 import pytest
 import yaml
-from elaws_parser.parser.text_converter import convert_xml_to_text
-from elaws_parser.parser.yaml_converter import convert_xml_to_yaml
+from elaws_parser.parser.text_converter import (
+    convert_laws_to_text,
+    convert_xml_to_text,
+    parse_mainprovision_to_text,
+)
+from elaws_parser.parser import yaml_converter
+from elaws_parser.parser.yaml_converter import (
+    LawToYamlConverter,
+    clear_yaml_cache,
+    convert_laws_to_yaml,
+    convert_xml_to_yaml,
+)
+from elaws_parser.utils.kanji import kanji_to_int
 
 # データディレクトリの特定
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
@@ -95,3 +108,240 @@ def test_law_parsing_snapshot(xml_path, txt_path, yaml_path):
     assert (
         norm_actual == norm_expected
     ), f"YAML mismatch for {os.path.basename(xml_path)}"
+
+
+def test_convert_xml_to_text_requires_main_provision():
+    xml_data = (
+        "<LawData><law_full_text><Law><LawBody>"
+        "<TOC><TOCLabel>目次</TOCLabel></TOC>"
+        "</LawBody></Law></law_full_text></LawData>"
+    )
+    with pytest.raises(ValueError, match="MainProvision"):
+        convert_xml_to_text(xml_data)
+
+
+def test_parse_mainprovision_to_text_invalid_xml():
+    with pytest.raises(ValueError, match="Invalid XML format"):
+        parse_mainprovision_to_text("<MainProvision>")
+
+    with pytest.raises(ValueError, match="Unknown XML structure"):
+        parse_mainprovision_to_text("<MainProvision/>")
+
+
+def test_convert_laws_to_text_keeps_order():
+    xml_template = (
+        "<LawData><law_full_text><Law><LawBody><MainProvision>"
+        "<Article><ArticleTitle>{}</ArticleTitle></Article>"
+        "</MainProvision></LawBody></Law></law_full_text></LawData>"
+    )
+    xml_strings = [xml_template.format(f"第{i}条") for i in range(1, 6)]
+
+    result = convert_laws_to_text(xml_strings, workers=2)
+
+    assert result == [convert_xml_to_text(x) for x in xml_strings]
+    assert result[0] == "第1条"
+
+
+def test_ruby_text_in_sentences():
+    xml_data = (
+        "<MainProvision><Article><Paragraph><ParagraphSentence>"
+        "<Sentence><Ruby>砒<Rt>ひ</Rt></Ruby>素</Sentence>"
+        "<Sentence><Ruby>喀痰<Rt/></Ruby>の検査</Sentence>"
+        "</ParagraphSentence></Paragraph></Article></MainProvision>"
+    )
+    assert parse_mainprovision_to_text(xml_data) == "砒（ひ）素\n喀痰の検査"
+
+
+def test_yaml_converter_accepts_file_object():
+    xml_data = (
+        "<LawData><revision_info><law_title>テスト法</law_title></revision_info>"
+        "<law_full_text><Law><LawNum>令和元年法律第一号</LawNum><LawBody>"
+        "<MainProvision><Article Num=\"1\"><ArticleTitle>第一条</ArticleTitle>"
+        "</Article></MainProvision>"
+        "<SupplProvision><SupplProvisionLabel>附　則</SupplProvisionLabel>"
+        "</SupplProvision>"
+        "</LawBody></Law></law_full_text></LawData>"
+    ).encode("utf-8")
+
+    result = LawToYamlConverter(io.BytesIO(xml_data)).convert()
+
+    assert result == LawToYamlConverter(xml_data).convert()
+    assert list(result) == ["law_info", "articles", "supplementary_provisions"]
+    assert result["law_info"] == {"title": "テスト法"}
+    assert result["articles"] == [{"title": "第一条", "article_num": "1"}]
+
+    stream = io.StringIO()
+    LawToYamlConverter(xml_data).dump_yaml(stream)
+    assert stream.getvalue() == convert_xml_to_yaml(xml_data)
+
+
+@pytest.mark.parametrize(
+    "kanji, expected",
+    [
+        ("十一", 11),
+        ("二十", 20),
+        ("百五", 105),
+        ("二千三百四十五", 2345),
+        ("弐拾参", 23),
+        ("万", 10000),
+        ("二万三千", 23000),
+        ("十万五", 100005),
+        ("一x", None),
+    ],
+)
+def test_kanji_to_int(kanji, expected):
+    assert kanji_to_int(kanji) == expected
+
+
+def test_convert_xml_to_yaml_is_cached(monkeypatch):
+    xml_data = (
+        "<LawData><law_full_text><Law><LawBody><MainProvision>"
+        "<Article><ArticleTitle>第一条</ArticleTitle></Article>"
+        "</MainProvision></LawBody></Law></law_full_text></LawData>"
+    )
+    clear_yaml_cache()
+    calls = []
+    original = LawToYamlConverter.to_yaml_string
+
+    def counting_to_yaml_string(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(LawToYamlConverter, "to_yaml_string", counting_to_yaml_string)
+
+    first = convert_xml_to_yaml(xml_data)
+    second = convert_xml_to_yaml(xml_data.encode("utf-8"))
+
+    assert first == second
+    assert len(calls) == 1
+    # キャッシュには入力XMLそのものではなく，ダイジェストだけを保持する
+    assert list(yaml_converter._yaml_cache) == [
+        hashlib.sha1(xml_data.encode("utf-8")).hexdigest()
+    ]
+
+
+def test_yaml_ruby_text_in_sentences():
+    xml_data = (
+        "<LawData><law_full_text><Law><LawBody><MainProvision>"
+        "<Article><Paragraph><ParagraphSentence>"
+        "<Sentence><Ruby>砒<Rt>ひ</Rt></Ruby>素</Sentence>"
+        "<Sentence><Ruby>喀痰<Rt/></Ruby>の検査</Sentence>"
+        "</ParagraphSentence></Paragraph></Article>"
+        "</MainProvision></LawBody></Law></law_full_text></LawData>"
+    )
+    result = LawToYamlConverter(xml_data).convert()
+
+    assert result["articles"][0]["paragraphs"][0]["content"] == "砒（ひ）素 喀痰の検査"
+
+
+def test_convert_laws_to_yaml_keeps_order():
+    xml_template = (
+        "<LawData><law_full_text><Law><LawBody><MainProvision>"
+        "<Article><ArticleTitle>{}</ArticleTitle></Article>"
+        "</MainProvision></LawBody></Law></law_full_text></LawData>"
+    )
+    xml_strings = [xml_template.format(f"第{i}条") for i in range(1, 6)]
+
+    result = convert_laws_to_yaml(xml_strings, workers=2)
+
+    assert result == [convert_xml_to_yaml(x) for x in xml_strings]
+    assert yaml.safe_load(result[0]) == {"articles": [{"title": "第1条"}]}
+
+
+def test_table_in_item_sentence():
+    xml_data = (
+        "<MainProvision><Article><ArticleTitle>第一条</ArticleTitle><Paragraph>"
+        "<ParagraphSentence><Sentence>本文</Sentence></ParagraphSentence>"
+        "<Item><ItemTitle>一</ItemTitle><ItemSentence><Table><TableRow>"
+        "<TableColumn><Sentence>表の中身</Sentence></TableColumn>"
+        "<TableColumn><Sentence>右</Sentence></TableColumn>"
+        "</TableRow></Table></ItemSentence></Item>"
+        "</Paragraph></Article></MainProvision>"
+    )
+    assert parse_mainprovision_to_text(xml_data) == "第一条\n本文\n一\n表の中身\n右"
+
+
+def test_yaml_data_stays_plain_after_dump():
+    xml_data = (
+        "<LawData><law_full_text><Law><LawBody><MainProvision>"
+        "<Article Num=\"1\"><ArticleTitle>第一条</ArticleTitle></Article>"
+        "</MainProvision></LawBody></Law></law_full_text></LawData>"
+    )
+    converter = LawToYamlConverter(xml_data)
+    yaml_str = converter.to_yaml_string()
+
+    assert converter.yaml_data == {
+        "articles": [{"title": "第一条", "article_num": "1"}]
+    }
+    assert yaml.safe_load(yaml.safe_dump(converter.yaml_data)) == yaml.safe_load(
+        yaml_str
+    )
+
+
+def test_suppl_paragraph_keeps_amend_provision_and_tables():
+    table = (
+        "<TableStruct><Table><TableRow><TableColumn><Sentence>{}</Sentence>"
+        "</TableColumn></TableRow></Table></TableStruct>"
+    )
+    xml_data = (
+        "<LawData><law_full_text><Law><LawBody>"
+        "<MainProvision><Article><ArticleTitle>第一条</ArticleTitle></Article>"
+        "</MainProvision>"
+        "<SupplProvision><Paragraph><ParagraphNum/>"
+        "<ParagraphSentence><Sentence>次のように改正する。</Sentence>"
+        "</ParagraphSentence>"
+        "<AmendProvision><AmendProvisionSentence>"
+        "<Sentence>第三条中「甲」を「乙」に改める。</Sentence>"
+        "</AmendProvisionSentence></AmendProvision>"
+        + table.format("表一")
+        + table.format("表二")
+        + "</Paragraph></SupplProvision>"
+        "</LawBody></Law></law_full_text></LawData>"
+    )
+    result = LawToYamlConverter(xml_data).convert()
+
+    assert result["supplementary_provisions"] == [
+        {
+            "paragraphs": [
+                {
+                    "content": "次のように改正する。 第三条中「甲」を「乙」に改める。",
+                    "tables": [{"rows": [["表一"]]}, {"rows": [["表二"]]}],
+                }
+            ]
+        }
+    ]
+
+
+def test_text_emits_every_table_struct():
+    table = (
+        "<TableStruct><Table><TableRow><TableColumn><Sentence>{}</Sentence>"
+        "</TableColumn></TableRow></Table></TableStruct>"
+    )
+    xml_data = (
+        "<MainProvision><Article><ArticleTitle>第一条</ArticleTitle><Paragraph>"
+        "<ParagraphSentence><Sentence>本文</Sentence></ParagraphSentence>"
+        + table.format("表一")
+        + table.format("表二")
+        + "</Paragraph><Paragraph><Item><ItemTitle>一</ItemTitle>"
+        "<ItemSentence><Sentence>号</Sentence></ItemSentence>"
+        + table.format("表三")
+        + table.format("表四")
+        + "</Item></Paragraph></Article></MainProvision>"
+    )
+    lines = parse_mainprovision_to_text(xml_data).split("\n")
+
+    tables = [line for line in lines if line.startswith("|表")]
+    assert tables == ["|表一|", "|表二|", "|表三|", "|表四|"]
+
+
+def test_table_cell_uses_direct_sentences_only():
+    xml_data = (
+        "<MainProvision><Article><ArticleTitle>第一条</ArticleTitle><Paragraph>"
+        "<ParagraphSentence><Sentence>本文</Sentence></ParagraphSentence>"
+        "<TableStruct><Table><TableRow><TableColumn>"
+        "<Sentence>直下</Sentence><Column><Sentence>列</Sentence></Column>"
+        "<Item><ItemSentence><Sentence>号</Sentence></ItemSentence></Item>"
+        "</TableColumn></TableRow></Table></TableStruct>"
+        "</Paragraph></Article></MainProvision>"
+    )
+    assert parse_mainprovision_to_text(xml_data) == "第一条\n本文\n|直下|"